@@ -10,6 +10,7 @@
 
 import os
 import sys
+import threading
 import toml
 from typing import Dict, Any, Optional
 
@@ -44,6 +45,10 @@ class Config:
                 "minimize_to_tray": True
             },
             "window": {
+                # saveGeometry序列化的窗口几何（base64），一个键覆盖
+                # 大小/位置/屏幕信息；空串表示首次运行按默认居中
+                "geometry": "",
+                # 以下为旧版逐字段几何键，仅用于从旧配置迁移时回退
                 "width": 550,
                 "height": 750,
                 "pos_x": -1,  # -1 表示居中显示
@@ -56,10 +61,20 @@ class Config:
         
         # 获取配置文件路径
         self.config_path = self._get_config_path()
-        
+
         # 加载配置
         self.config = self.load_config()
-        
+
+        # 内存配置版本号：每次set()自增。下游模块的解析缓存以
+        # (文件mtime, 版本号)为键，内存中的修改无需落盘即可使缓存失效
+        self.data_version = 0
+
+        # 异步写盘：请求只置位事件，由后台线程合并后统一落盘。
+        # 线程在首次request_save()时才惰性启动
+        self._save_event = threading.Event()
+        self._writer_stop = threading.Event()
+        self._writer_thread = None
+
         self._initialized = True
     
     def _get_config_path(self) -> str:
@@ -132,11 +147,57 @@ class Config:
                 self.config[section] = {}
             
             self.config[section][key] = value
+            self.data_version += 1
             return True
         except Exception as e:
             logger.error(f"设置配置项失败: {str(e)}")
             return False
     
+    def request_save(self) -> None:
+        """请求异步保存配置
+
+        只唤醒后台写盘线程并立即返回，调用方（通常是GUI线程）不再
+        承担同步磁盘写入；200毫秒合并窗口内的多次请求只落盘一次。
+        """
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, daemon=True
+            )
+            self._writer_thread.start()
+        self._save_event.set()
+
+    def _writer_loop(self) -> None:
+        """后台写盘线程主循环"""
+        while not self._writer_stop.is_set():
+            self._save_event.wait()
+            if self._writer_stop.is_set():
+                break
+            # 合并窗口：等200毫秒收拢紧随其后的保存请求，再统一清除并落盘
+            if self._writer_stop.wait(0.2):
+                break
+            self._save_event.clear()
+            self.save_config()
+
+    def flush(self) -> None:
+        """停止后台写盘线程并同步执行最后一次保存（退出前调用）"""
+        self._writer_stop.set()
+        self._save_event.set()
+        if self._writer_thread is not None:
+            self._writer_thread.join(timeout=2.0)
+        self.save_config()
+
+    def set_many(self, updates: Dict[str, Dict[str, Any]]) -> bool:
+        """批量设置多个配置项并只落盘一次
+
+        逐项调用set()后统一save_config()，把一次用户操作涉及的
+        多个配置修改合并为单次文件写入。
+        """
+        for section, items in updates.items():
+            for key, value in items.items():
+                if not self.set(section, key, value):
+                    return False
+        return self.save_config()
+
     def get_hosts_data(self) -> str:
         """获取hosts数据"""
         return self.get("hosts", "data", self.default_config["hosts"]["data"])
@@ -7,7 +7,7 @@
 
 import os
 import threading
-from typing import Callable, Tuple
+from typing import Callable, List, Tuple
 
 from . import logger
 from .config import config
@@ -34,68 +34,91 @@ class ContrastModule:
         
         # 工作线程
         self.contrast_thread = None
-        
+
+        # 配置hosts数据行解析结果缓存，以配置文件mtime为键：
+        # 配置很少变化而对比每次文件事件都会触发，无需重复解析
+        self._config_cache = (None, None)
+
         self._initialized = True
     
     def set_repair_callback(self, callback: Callable[[], None]) -> None:
         """设置修复回调函数"""
         self.repair_callback = callback
     
-    def _read_hosts_file(self) -> Tuple[bool, str]:
-        """读取hosts文件内容"""
+    def _read_hosts_file(self) -> Tuple[bool, bytes]:
+        """读取hosts文件内容（原始UTF-8字节，不做解码）
+
+        对比全程以bytes进行，与修复模块一致，省去整个文件的
+        UTF-8解码往返；仅日志输出时才按需解码。
+        """
         hosts_path = monitor.get_hosts_path()
-        
+
         try:
             if not os.path.exists(hosts_path):
                 logger.error(f"hosts文件不存在: {hosts_path}")
-                return False, ""
-            
-            with open(hosts_path, 'r', encoding='utf-8') as f:
+                return False, b""
+
+            with open(hosts_path, 'rb') as f:
                 content = f.read()
-            
-            logger.info(f"成功读取hosts文件: {hosts_path}")
+
+            logger.debug("成功读取hosts文件: %s", hosts_path)
             return True, content
         except Exception as e:
             logger.error(f"读取hosts文件失败: {str(e)}")
-            return False, ""
+            return False, b""
     
-    def _check_hosts_content(self, hosts_content: str, config_hosts_data: str) -> bool:
+    def _get_config_lines(self) -> List[bytes]:
+        """获取配置中的hosts数据行（UTF-8字节，已strip，忽略空行，包含所有注释行）
+
+        解析结果以配置文件mtime为键缓存，仅在配置变化后重新解析，
+        编码也在缓存加载时一次完成。
+        """
+        try:
+            mtime = os.stat(config.config_path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        # 版本号参与缓存键：set()后尚未落盘的内存修改也能使缓存失效
+        cache_key = (mtime, config.data_version)
+
+        key, lines = self._config_cache
+        if key is None or key != cache_key:
+            # 所有注释行都参与检查，不再限制只检查"# Hosts Monitor 数据"部分
+            lines = [
+                stripped
+                for line in config.get_hosts_data().encode('utf-8').splitlines()
+                if (stripped := line.strip())
+            ]
+            self._config_cache = (cache_key, lines)
+
+        return lines
+
+    def _check_hosts_content(self, hosts_content: bytes) -> bool:
         """检查hosts文件内容是否完整包含配置数据"""
-        # 获取配置的hosts数据行（忽略空行，包含所有注释行）
-        config_lines = []
-        is_hosts_monitor_data = False
-        
-        for line in config_hosts_data.splitlines():
-            stripped_line = line.strip()
-            if not stripped_line:
-                continue
-                
-            # 特殊处理"# Hosts Monitor 数据"等注释行
-            if "# Hosts Monitor 数据" in stripped_line:
-                is_hosts_monitor_data = True
-                config_lines.append(stripped_line)
-            # 所有注释行都加入到检查中，不再限制只检查"# Hosts Monitor 数据"部分的注释
-            elif stripped_line.startswith('#'):
-                config_lines.append(stripped_line)
-            # 非注释行正常处理
-            elif not stripped_line.startswith('#'):
-                config_lines.append(stripped_line)
-        
+        # 获取配置的hosts数据行（带缓存）
+        config_lines = self._get_config_lines()
+
         if not config_lines:
             logger.info("配置文件中没有有效的hosts数据")
             return True
         
-        # 获取hosts文件内容行
-        hosts_lines = [line.strip() for line in hosts_content.splitlines()]
-        
+        # 对hosts内容做一次线性扫描建立行集合，把每行配置的查找
+        # 从O(N)列表遍历降为O(1)集合命中，整体由O(N·M)降为O(N+M)
+        hosts_lines = {line.strip() for line in hosts_content.splitlines()}
+
         # 检查每行配置是否存在于hosts文件中
-        missing_lines = []
-        for config_line in config_lines:
-            if config_line not in hosts_lines:
-                missing_lines.append(config_line)
+        missing_lines = [
+            config_line
+            for config_line in config_lines
+            if config_line not in hosts_lines
+        ]
         
         if missing_lines:
-            logger.info(f"hosts文件缺少以下内容: {missing_lines}")
+            # 仅在需要输出日志时才解码
+            logger.info(
+                "hosts文件缺少以下内容: %s",
+                [line.decode('utf-8', errors='replace') for line in missing_lines],
+            )
             return False
         else:
             logger.info("hosts文件内容完整")
@@ -112,11 +135,8 @@ class ContrastModule:
                 logger.error("获取hosts文件读取权限失败")
                 return
             
-            # 获取配置中的hosts数据
-            config_hosts_data = config.get_hosts_data()
-            
-            # 对比内容
-            is_complete = self._check_hosts_content(hosts_content, config_hosts_data)
+            # 对比内容（配置数据行在_check_hosts_content内按mtime缓存）
+            is_complete = self._check_hosts_content(hosts_content)
             
             if not is_complete:
                 logger.info("检测到hosts文件内容不完整，启动修复模块")
@@ -5,6 +5,7 @@ UI控制器模块
 """
 
 import atexit
+import logging
 
 from . import logger
 from .config import config
@@ -15,6 +16,14 @@ from .repair import repair_module
 # 避免循环导入问题，在需要时动态导入UI类
 # from .ui import HostsMonitorUI
 
+# 按日志级别预生成的HTML着色前缀：错误/警告直接由级别决定颜色，
+# 无需在GUI线程扫描消息文本；其余级别回退到UI的关键词着色
+_LEVEL_SPAN = {
+    logging.ERROR: '<span style="color:#e74c3c;">',
+    logging.CRITICAL: '<span style="color:#e74c3c;">',
+    logging.WARNING: '<span style="color:#e67e22;">',
+}
+
 
 class Controller:
     """控制器类"""
@@ -102,10 +111,19 @@ class Controller:
         # 对比模块 -> 修复模块
         contrast_module.set_repair_callback(repair_module.start)
 
-    def log_to_ui(self, message: str) -> None:
-        """将日志消息更新到UI"""
+    def log_to_ui(self, message: str, level: int = logging.INFO) -> None:
+        """将日志消息更新到UI（入环形缓冲，由UI线程定时批量取走）
+
+        HTML着色在发射线程完成：错误/警告按级别直接取预生成前缀，
+        其余级别走关键词着色，GUI线程收到的已是成品HTML。
+        """
         if self.ui:
-            self.ui.log_updated.emit(message)
+            prefix = _LEVEL_SPAN.get(level)
+            if prefix is not None:
+                html = f"{prefix}{message}</span>"
+            else:
+                html = self.ui._format_log_message(message)
+            self.ui.enqueue_log(html)
 
     def on_ui_initialized(self) -> None:
         """UI初始化完成后的处理"""
@@ -156,6 +174,8 @@ class Controller:
         logger.info("正在停止监控服务...")
         try:
             monitor.stop()
+            # 同时停止修复模块，打断可能正在延迟等待中的修复
+            repair_module.stop()
             logger.info("监控服务已停止")
         except Exception as e:
             logger.error(f"停止监控服务时发生错误: {str(e)}")
@@ -65,38 +65,45 @@ class HostsMonitorLogger:
         
         self._initialized = True
     
-    def set_ui_callback(self, callback: Callable[[str], None]) -> None:
-        """设置UI更新回调函数"""
+    def set_ui_callback(self, callback: Callable[[str, int], None]) -> None:
+        """设置UI更新回调函数（参数为格式化后的日志行和logging级别）"""
         self.ui_update_callback = callback
     
-    def _log(self, level: int, message: str) -> None:
-        """内部日志记录方法"""
-        self.logger.log(level, message)
+    def _log(self, level: int, message: str, *args) -> None:
+        """内部日志记录方法
+
+        支持%风格的延迟格式化参数：标准logging会在级别检查通过后
+        才做格式化，热路径上被丢弃的日志不再产生字符串构建开销。
+        """
+        self.logger.log(level, message, *args)
         if self.ui_update_callback:
+            if args:
+                message = message % args
             timestamp = datetime.now().strftime(DATE_FORMAT)
             level_name = logging.getLevelName(level)
             log_message = f"{timestamp} [{level_name}] {message}"
-            self.ui_update_callback(log_message)
-    
-    def debug(self, message: str) -> None:
+            # 把日志级别一并传给回调，下游按级别着色无需再扫描消息文本
+            self.ui_update_callback(log_message, level)
+
+    def debug(self, message: str, *args) -> None:
         """记录调试级别日志"""
-        self._log(logging.DEBUG, message)
-    
-    def info(self, message: str) -> None:
+        self._log(logging.DEBUG, message, *args)
+
+    def info(self, message: str, *args) -> None:
         """记录信息级别日志"""
-        self._log(logging.INFO, message)
-    
-    def warning(self, message: str) -> None:
+        self._log(logging.INFO, message, *args)
+
+    def warning(self, message: str, *args) -> None:
         """记录警告级别日志"""
-        self._log(logging.WARNING, message)
-    
-    def error(self, message: str) -> None:
+        self._log(logging.WARNING, message, *args)
+
+    def error(self, message: str, *args) -> None:
         """记录错误级别日志"""
-        self._log(logging.ERROR, message)
-    
-    def critical(self, message: str) -> None:
+        self._log(logging.ERROR, message, *args)
+
+    def critical(self, message: str, *args) -> None:
         """记录严重错误级别日志"""
-        self._log(logging.CRITICAL, message)
+        self._log(logging.CRITICAL, message, *args)
 
 
 # 全局日志对象
@@ -106,12 +106,9 @@ def check_and_run_as_admin() -> bool:
                 paths = get_app_paths()
                 app_path = paths["app_path"]
 
-                # 准备命令行参数
-                if paths["is_frozen"]:
-                    app_args = "--already-trying-uac --skip-admin-check"
-                    if is_restarting:
-                        app_args += " --restarting"
-                else:
+                # 准备命令行参数（用列表收集后一次性join，避免重复字符串拼接）
+                arg_parts = []
+                if not paths["is_frozen"]:
                     # 查找入口脚本
                     run_script_path = os.path.abspath(
                         os.path.join(paths["app_dir"], "..", "run.py")
@@ -121,11 +118,11 @@ def check_and_run_as_admin() -> bool:
                         if os.path.exists(run_script_path)
                         else paths["script_path"]
                     )
-                    app_args = (
-                        f'"{script_path}" --already-trying-uac --skip-admin-check'
-                    )
-                    if is_restarting:
-                        app_args += " --restarting"
+                    arg_parts.append(f'"{script_path}"')
+                arg_parts.extend(["--already-trying-uac", "--skip-admin-check"])
+                if is_restarting:
+                    arg_parts.append("--restarting")
+                app_args = " ".join(arg_parts)
 
                 # 设置工作目录
                 work_dir = (
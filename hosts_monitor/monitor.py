@@ -5,11 +5,12 @@
 - 监控配置文件变化
 """
 
+import hashlib
 import os
 import sys
 import threading
 import time
-from typing import Callable
+from typing import Callable, Optional
 
 import watchfiles
 from watchfiles import watch
@@ -39,18 +40,29 @@ class HostsMonitor:
         # 配置文件路径
         self.config_path = config.config_path
         
-        # 上次处理时间
-        self.last_process_time = 0
-        
-        # 去抖动时间（秒）
+        # 去抖动时间（秒），作为watch的Rust侧去抖动窗口，下次启动监控时生效
         self.debounce_time = 2
         
         # 监控线程
         self.monitor_thread = None
         self.stop_event = threading.Event()
+
+        # 工作线程进入watch循环后置位，供start()确定性等待就绪
+        self.ready_event = threading.Event()
         
         # 比对回调
         self.contrast_callback = None
+
+        # 运行状态回调：监控线程启动/退出时边沿触发，供UI等订阅方
+        # 即时感知状态变化，取代周期性轮询is_alive()
+        self.status_callback = None
+
+        # 已校验存在的监控路径缓存；出错重试时置空以重新校验
+        self._valid_paths = None
+
+        # 最近一次修复写入后的hosts内容摘要：用于识别修复模块自身的
+        # 写入事件，避免自触发的"读+拆分+比对"整套流程空转
+        self._last_known_digest: Optional[bytes] = None
         
         self._initialized = True
         
@@ -67,89 +79,142 @@ class HostsMonitor:
     def set_contrast_callback(self, callback: Callable[[], None]) -> None:
         """设置比对回调函数"""
         self.contrast_callback = callback
+
+    def set_status_callback(self, callback: Callable[[bool], None]) -> None:
+        """设置运行状态回调函数（参数为监控是否在运行）"""
+        self.status_callback = callback
+
+    def _notify_status(self, running: bool) -> None:
+        """通知订阅方监控运行状态变化（在监控线程中调用）"""
+        if self.status_callback:
+            try:
+                self.status_callback(running)
+            except Exception as e:
+                logger.error("通知监控状态变化时发生错误: %s", str(e))
     
-    def _debounce(self) -> bool:
-        """去抖动/节流，避免短时间内重复处理"""
-        current_time = time.time()
-        if current_time - self.last_process_time < self.debounce_time:
-            logger.debug(f"触发去抖动逻辑，跳过此次处理 (间隔: {current_time - self.last_process_time:.2f}秒)")
-            return False
-        
-        self.last_process_time = current_time
-        return True
-    
-    def _monitor_files(self) -> None:
-        """监控文件变化的内部方法"""
-        try:
-            # 检查监控的文件是否存在
+    def _fire_contrast(self) -> None:
+        """触发比对回调"""
+        if self.stop_event.is_set():
+            return
+        if self.contrast_callback:
+            logger.info("触发对比模块")
+            self.contrast_callback()
+
+    def _watch_once(self) -> bool:
+        """执行一轮文件监控
+
+        返回:
+            bool: True表示应继续重试监控，False表示应结束监控
+        """
+        # 检查监控的文件是否存在（结果缓存，仅在出错重试后重新stat）
+        valid_paths = self._valid_paths
+        if valid_paths is None:
             valid_paths = []
-            
+
             if os.path.exists(self.hosts_path):
                 valid_paths.append(self.hosts_path)
             else:
                 logger.warning(f"hosts文件不存在: {self.hosts_path}")
-            
+
             if os.path.exists(self.config_path):
                 valid_paths.append(self.config_path)
             else:
                 logger.warning(f"配置文件不存在: {self.config_path}")
-            
+
             if not valid_paths:
                 logger.error("没有可监控的有效文件路径")
-                return
-            
-            logger.info(f"开始监控文件: {valid_paths}")
-            
-            # 初始化完成后触发一次比对
-            if self.contrast_callback:
-                self.contrast_callback()
-                
-            # 直接监控指定文件列表
-            watch_kwargs = {
-                "watch_filter": None,  # 不过滤任何事件
-                "stop_event": self.stop_event,
-                "debounce": 500,  # 内部去抖动，单位毫秒
-                "debug": False,  # 启用调试以获取更多信息
-                "yield_on_timeout": True,  # 即使没有变化也定期返回，使停止更可靠
-            }
-            
-            try:
-                # 直接传入文件路径列表，而不是目录
-                for changes in watch(*valid_paths, **watch_kwargs):
-                    if self.stop_event.is_set():
+                return False
+
+            self._valid_paths = valid_paths
+
+        logger.info(f"开始监控文件: {valid_paths}")
+
+        # 预先归一化待比较的路径，避免在事件热循环中重复做字符串处理
+        watched_paths = {os.path.normcase(os.path.normpath(p)) for p in valid_paths}
+        config_norm = os.path.normcase(os.path.normpath(self.config_path))
+
+        def hosts_filter(change_type, path):
+            """定向过滤：只放行我们关注的文件，其余事件在进入循环体前丢弃"""
+            return os.path.normcase(os.path.normpath(path)) in watched_paths
+
+        # 初始化完成后触发一次比对
+        if self.contrast_callback:
+            self.contrast_callback()
+
+        # 直接监控指定文件列表。去抖动只保留Rust侧这一层：
+        # 它已经在最低层合并事件突发，Python侧再叠一层定时器
+        # 只会增加延迟和线程簿记，没有额外的安全收益
+        debounce_ms = max(int(self.debounce_time * 1000), 500)
+        watch_kwargs = {
+            "watch_filter": hosts_filter,  # 定向过滤，减少无关事件唤醒后续处理
+            "stop_event": self.stop_event,
+            "debounce": debounce_ms,  # 内部去抖动，单位毫秒
+            "debug": False,  # 启用调试以获取更多信息
+            "yield_on_timeout": True,  # 即使没有变化也定期返回，使停止更可靠
+            # Rust侧空转超时与去抖动时间对齐：空闲时减少Python侧无效唤醒，
+            # 代价是极端无事件场景下停止延迟最多增加到该值（线程为daemon，可接受）
+            "rust_timeout": debounce_ms,
+        }
+
+        # 即将进入watch循环，通知start()监控已就绪
+        self.ready_event.set()
+
+        # 直接传入文件路径列表，而不是目录
+        for changes in watch(*valid_paths, **watch_kwargs):
+            if self.stop_event.is_set():
+                break
+
+            # 如果没有变化则继续循环
+            if not changes:
+                continue
+
+            # 过滤器已保证批内都是我们关注的文件，取一条用于日志即可
+            change_type, path = next(iter(changes))
+            logger.info("检测到文件变化: %s (变化类型: %s)", path, change_type)
+
+            # 纯hosts变化且内容摘要未变时跳过：修复模块写入后会登记
+            # 摘要，监控据此识别自己触发的事件，不再空转整个比对链
+            # （配置文件未在监控范围内时直接短路，免去逐路径归一化）
+            config_changed = config_norm in watched_paths and any(
+                os.path.normcase(os.path.normpath(p)) == config_norm
+                for _, p in changes
+            )
+            if not config_changed and self._hosts_digest_unchanged():
+                logger.debug("hosts内容摘要未变化，跳过比对")
+                continue
+
+            # Rust侧去抖动已保证事件流安静，直接触发对比模块
+            self._fire_contrast()
+
+        return False
+
+    def _monitor_files(self) -> None:
+        """监控文件变化的内部方法
+
+        出错后在外层while循环中延迟重试，而不是递归调用自身：
+        CPython没有尾调用优化，文件系统反复抖动时递归会不断
+        增长调用栈并最终以RecursionError杀死监控线程。
+        """
+        try:
+            self._notify_status(True)
+            while not self.stop_event.is_set():
+                try:
+                    if not self._watch_once():
                         break
-                    
-                    # 如果没有变化则继续循环
-                    if not changes:
-                        continue
-                    
-                    if not self._debounce():
-                        continue
-                    
-                    # 检查是否有我们关注的文件变化
-                    for change_type, path in changes:
-                        if path in valid_paths:
-                            logger.info(f"检测到文件变化: {path} (变化类型: {change_type})")
-                            
-                            # 触发对比模块
-                            if self.contrast_callback:
-                                logger.info("触发对比模块")
-                                self.contrast_callback()
-                                break  # 一批变化只需触发一次比对
-            
-            except Exception as e:
-                logger.error(f"监控文件时发生错误: {str(e)}")
-                
-                # 错误后短暂延迟并重试
-                if not self.stop_event.is_set():
-                    logger.info("3秒后尝试重新启动文件监控...")
-                    self.stop_event.wait(3.0)
+                except Exception as e:
+                    logger.error("监控文件时发生错误: %s", str(e))
+
+                    # 路径可能已失效（如文件被删除），重试时重新校验
+                    self._valid_paths = None
+
+                    # 错误后短暂延迟并重试
                     if not self.stop_event.is_set():
-                        return self._monitor_files()  # 递归调用重新开始监控
-        
+                        logger.info("3秒后尝试重新启动文件监控...")
+                        self.stop_event.wait(3.0)
         except Exception as e:
             logger.error(f"监控文件主循环发生错误: {str(e)}")
         finally:
+            self._notify_status(False)
             logger.info("文件监控已停止")
     
     def start(self) -> None:
@@ -159,9 +224,15 @@ class HostsMonitor:
             return
         
         self.stop_event.clear()
+        self.ready_event.clear()
         self.monitor_thread = threading.Thread(target=self._monitor_files, daemon=True)
         self.monitor_thread.start()
-        logger.info("监控模块已启动")
+
+        # 等待工作线程进入watch循环（事件通知，无轮询）
+        if self.ready_event.wait(timeout=2.0):
+            logger.info("监控模块已启动")
+        else:
+            logger.warning("监控模块启动超时，可能没有可监控的有效文件")
     
     def stop(self) -> None:
         """停止监控"""
@@ -181,6 +252,21 @@ class HostsMonitor:
         """获取hosts文件路径"""
         return self.hosts_path
 
+    def update_known_digest(self, content: bytes) -> None:
+        """登记修复模块刚写入的hosts内容摘要，供事件过滤使用"""
+        self._last_known_digest = hashlib.blake2b(content, digest_size=16).digest()
+
+    def _hosts_digest_unchanged(self) -> bool:
+        """判断当前hosts文件内容摘要是否与已登记的摘要一致"""
+        if self._last_known_digest is None:
+            return False
+        try:
+            with open(self.hosts_path, 'rb') as f:
+                digest = hashlib.blake2b(f.read(), digest_size=16).digest()
+        except OSError:
+            return False
+        return digest == self._last_known_digest
+
     def set_debounce_time(self, seconds: float) -> None:
         """设置去抖动时间（秒）
         
@@ -5,10 +5,16 @@
 - 按修复逻辑修复hosts文件
 """
 
+import hashlib
+import mmap
+import msvcrt
+import os
+import queue
 import threading
 import time
 from typing import List, Tuple, Optional
 
+import win32api
 import win32con
 import win32file
 
@@ -19,8 +25,11 @@ from .monitor import monitor
 
 class RepairModule:
     """修复模块类"""
-    
+
     _instance = None
+
+    # 管理员权限检查结果缓存：进程生命周期内不会变化，只查询一次
+    _is_admin_cache = None
     
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -32,214 +41,337 @@ class RepairModule:
         if self._initialized:
             return
         
-        # 工作线程
-        self.repair_thread = None
-        
         # 文件句柄
         self.file_handle = None
-        
+
+        # 配置hosts数据行缓存，以配置文件mtime为键，避免每次修复重新解析
+        # 值为(原始行, 比较用已strip行)两份，比较形式也只在缓存加载时算一次
+        self._config_cache = (None, None, None)
+
+        # 上次成功修复后的(hosts mtime, 配置 mtime)快照：两者都没变时
+        # 整个修复流程（等待、取句柄、读取、比对）都可以直接跳过
+        self._last_repair_state = None
+
+        # 修复请求队列：容量为1，等待中的请求自然吸收新的触发
+        self._repair_queue = queue.Queue(maxsize=1)
+
+        # 停止事件：置位后延迟等待立即返回，避免退出时卡在sleep里
+        self._stop_event = threading.Event()
+
+        # 常驻工作线程，避免每次修复都新建线程
+        self.repair_thread = threading.Thread(target=self._repair_loop, daemon=True)
+        self.repair_thread.start()
+
         self._initialized = True
+
+    def _repair_loop(self) -> None:
+        """常驻工作循环，逐个消费修复请求"""
+        while True:
+            self._repair_queue.get()
+            try:
+                self._repair_process()
+            except Exception as e:
+                logger.error(f"修复工作循环发生错误: {str(e)}")
+
+    def _drain_pending(self) -> None:
+        """清空队列中等待的修复触发（并入当前这次修复）"""
+        while True:
+            try:
+                self._repair_queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def _get_config_lines(self) -> Tuple[Tuple[bytes, ...], Tuple[bytes, ...]]:
+        """获取配置中的hosts数据行（UTF-8字节，已去除前后空行）
+
+        配置很少变化而修复可能频繁触发，因此以配置文件的mtime为键
+        缓存解析结果，仅在配置文件变化后重新解析。编码在缓存加载时
+        一次完成，修复流程全程以bytes处理，省去逐次的编解码往返。
+
+        返回:
+            (原始行, 比较用的已strip非空行)：两者都在缓存加载时一次
+            算好并冻结为tuple只读共享，修复热路径上零拷贝零strip
+        """
+        try:
+            mtime = os.stat(config.config_path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        # 版本号参与缓存键：set()后尚未落盘的内存修改也能使缓存失效
+        cache_key = (mtime, config.data_version)
+
+        key, lines, stripped = self._config_cache
+        if key is None or key != cache_key:
+            raw = config.get_hosts_data().encode('utf-8').splitlines()
+
+            # 移除配置数据中的前后空行，稍后会规范化添加
+            while raw and not raw[0].strip():
+                raw.pop(0)
+            while raw and not raw[-1].strip():
+                raw.pop()
+
+            # 冻结为tuple：调用方不可能改动缓存，无需逐次防御性拷贝
+            lines = tuple(raw)
+            stripped = tuple(s for line in raw if (s := line.strip()))
+
+            self._config_cache = (cache_key, lines, stripped)
+
+        return lines, stripped
     
     def _get_write_access(self, path: str) -> Tuple[bool, Optional[int]]:
-        """获取文件写入权限"""
-        try:
-            handle = win32file.CreateFile(
-                path,
-                win32con.GENERIC_READ | win32con.GENERIC_WRITE,
-                win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE,
-                None,
-                win32con.OPEN_EXISTING,
-                win32con.FILE_ATTRIBUTE_NORMAL,
-                None
-            )
-            
-            if handle == win32file.INVALID_HANDLE_VALUE:
-                logger.error("无法获取hosts文件写入权限")
+        """获取文件写入权限
+
+        共享模式只允许其他进程读取（FILE_SHARE_READ）：若同时允许
+        共享写，读取与写回之间其他程序的修改会被静默覆盖。独占写
+        意味着可能撞上共享冲突（winerror 32），对此做指数退避重试。
+        """
+        delay = 0.1
+        for attempt in range(3):
+            try:
+                handle = win32file.CreateFile(
+                    path,
+                    win32con.GENERIC_READ | win32con.GENERIC_WRITE,
+                    win32con.FILE_SHARE_READ,
+                    None,
+                    win32con.OPEN_EXISTING,
+                    # 顺序扫描提示：整读整写的访问模式下，缓存管理器
+                    # 会更积极地预读并及早释放已读页面
+                    win32con.FILE_ATTRIBUTE_NORMAL | win32con.FILE_FLAG_SEQUENTIAL_SCAN,
+                    None
+                )
+
+                if handle == win32file.INVALID_HANDLE_VALUE:
+                    logger.error("无法获取hosts文件写入权限")
+                    return False, None
+
+                logger.debug("成功获取hosts文件写入权限")
+                return True, handle
+            except Exception as e:
+                # 共享冲突：其他进程正打开着hosts文件，退避后重试
+                if getattr(e, 'winerror', None) == 32 and attempt < 2:
+                    logger.warning(f"hosts文件正被其他进程占用，{delay:.1f}秒后重试")
+                    time.sleep(delay)
+                    delay *= 2
+                    continue
+                logger.error(f"获取写入权限时发生错误: {str(e)}")
                 return False, None
-            
-            logger.info("成功获取hosts文件写入权限")
-            return True, handle
-        except Exception as e:
-            logger.error(f"获取写入权限时发生错误: {str(e)}")
-            return False, None
+
+        return False, None
     
     def _release_write_access(self, handle: int) -> None:
         """释放文件写入权限"""
         try:
             if handle:
                 win32file.CloseHandle(handle)
-                logger.info("已释放hosts文件写入权限")
+                logger.debug("已释放hosts文件写入权限")
         except Exception as e:
             logger.error(f"释放写入权限时发生错误: {str(e)}")
     
-    def _read_file_content(self, handle: int) -> Tuple[bool, str]:
-        """读取文件内容"""
+    def _open_mapping(self, handle: int, access: int) -> Tuple[Optional[mmap.mmap], Optional[int]]:
+        """基于已持有的句柄建立内存映射
+
+        先DuplicateHandle再转成C运行时fd：open_osfhandle会接管句柄的
+        生命周期，复制一份可避免关闭fd时把原句柄一并关掉。任何一步
+        失败都返回(None, None)，由调用方回退到ReadFile/WriteFile路径。
+        """
+        try:
+            proc = win32api.GetCurrentProcess()
+            dup = win32api.DuplicateHandle(
+                proc, handle, proc, 0, 0, win32con.DUPLICATE_SAME_ACCESS
+            )
+            fd = msvcrt.open_osfhandle(dup.Detach(), 0)
+        except Exception as e:
+            logger.debug(f"复制文件句柄失败，回退到常规读写: {str(e)}")
+            return None, None
+
+        try:
+            mm = mmap.mmap(fd, 0, access=access)
+            return mm, fd
+        except (OSError, ValueError) as e:
+            # 空文件无法映射等情况，属于可回退的正常路径
+            logger.debug(f"建立内存映射失败，回退到常规读写: {str(e)}")
+            os.close(fd)
+            return None, None
+
+    def _read_file_content(self, handle: int) -> Tuple[bool, bytes]:
+        """读取文件内容（原始UTF-8字节，不做解码）
+
+        优先通过内存映射读取，让缓存管理器按页供数，省去
+        SetFilePointer+ReadFile的系统调用往返；映射失败时回退。
+        """
+        mm, fd = self._open_mapping(handle, mmap.ACCESS_READ)
+        if mm is not None:
+            try:
+                return True, mm[:]
+            finally:
+                mm.close()
+                os.close(fd)
+
         try:
             # 将文件指针移动到文件开头
             win32file.SetFilePointer(handle, 0, win32file.FILE_BEGIN)
-            
-            # 读取文件内容
-            _, content = win32file.ReadFile(handle, 1024 * 1024)  # 最大读取1MB
-            
-            # 解码内容
-            text = content.decode('utf-8')
-            return True, text
+
+            # 按文件实际大小读取，既避免固定1MB缓冲的无谓分配，
+            # 也避免hosts文件超过1MB时被截断
+            size = win32file.GetFileSize(handle)
+            if size == 0:
+                return True, b""
+
+            _, content = win32file.ReadFile(handle, size)
+            return True, content
         except Exception as e:
             logger.error(f"读取文件内容时发生错误: {str(e)}")
-            return False, ""
-    
-    def _write_file_content(self, handle: int, content: str) -> bool:
-        """写入文件内容"""
+            return False, b""
+
+    @staticmethod
+    def _common_prefix_len(a: bytes, b: bytes) -> int:
+        """计算两段字节内容的公共前缀长度
+
+        先按4KB块比较（C层memcmp），仅在首个不同块内逐字节细化，
+        避免纯Python逐字节扫描整个文件。
+        """
+        n = min(len(a), len(b))
+        step = 4096
+        off = 0
+        while off < n and a[off:off + step] == b[off:off + step]:
+            off += step
+        end = min(off + step, n)
+        while off < end and a[off] == b[off]:
+            off += 1
+        # 末尾的不完整块整体相等时off会越过n，此处收敛回公共长度
+        return min(off, n)
+
+    def _write_file_content(self, handle: int, content: bytes, start: int = 0) -> bool:
+        """写入文件内容（已编码的UTF-8字节）
+
+        start为与现有内容的公共前缀长度：前缀之前的字节在磁盘上
+        已经一致，只写入从首个差异处开始的尾部，减少推入文件系统
+        缓存的字节量。优先通过内存映射写入（resize到目标大小后
+        赋值差异区间），失败或内容为空时回退到WriteFile路径。
+        """
+        if content:
+            mm, fd = self._open_mapping(handle, mmap.ACCESS_WRITE)
+            if mm is not None:
+                try:
+                    mm.resize(len(content))
+                    mm[start:] = content[start:]
+                    mm.flush()
+                    logger.debug("成功写入新的hosts文件内容")
+                    return True
+                except Exception as e:
+                    logger.debug(f"内存映射写入失败，回退到常规写入: {str(e)}")
+                finally:
+                    mm.close()
+                    os.close(fd)
+
         try:
-            # 将文件指针移动到文件开头
-            win32file.SetFilePointer(handle, 0, win32file.FILE_BEGIN)
-            
-            # 截断文件
+            # 将文件指针移动到首个差异位置
+            win32file.SetFilePointer(handle, start, win32file.FILE_BEGIN)
+
+            # 先写入新内容，再截断旧内容残留：避免先截断到0再写入
+            # 造成的"文件瞬间为空"窗口和多余的一次元数据更新
+            win32file.WriteFile(handle, content[start:])
             win32file.SetEndOfFile(handle)
-            
-            # 写入新内容
-            win32file.WriteFile(handle, content.encode('utf-8'))
-            
+
             # 刷新缓冲区
             win32file.FlushFileBuffers(handle)
-            
-            logger.info("成功写入新的hosts文件内容")
+
+            logger.debug("成功写入新的hosts文件内容")
             return True
         except Exception as e:
             logger.error(f"写入文件内容时发生错误: {str(e)}")
             return False
     
-    def _ensure_single_empty_lines(self, lines: List[str]) -> None:
+    def _ensure_single_empty_lines(self, lines: List[bytes]) -> None:
         """确保文件中只有单个空行，删除多余的空行
-        
+
+        单次线性扫描完成空行折叠：之前先pop末尾空行、再用
+        del逐个删除连续空行，最坏情况是O(N²)的元素搬移，
+        现在一趟重建，每行只经手一次。
+
         参数:
             lines: 文件的所有行
         """
-        # 1. 移除所有末尾空行
-        while lines and not lines[-1].strip():
-            lines.pop()
-        
-        # 2. 确保文件最后有且仅有一个换行符
-        lines.append("")
-        
-        # 3. 确保整个文件中不存在连续的空行
-        i = 1
-        while i < len(lines):
-            if not lines[i].strip() and not lines[i-1].strip():
-                del lines[i]
-            else:
-                i += 1
+        out = []
+        prev_blank = False
+        for line in lines:
+            blank = not line.strip()
+            if blank and prev_blank:
+                continue
+            out.append(line)
+            prev_blank = blank
+
+        # 移除末尾空行后补回一个空行，保证文件以单个换行符结尾
+        while out and not out[-1].strip():
+            out.pop()
+        out.append(b"")
+
+        lines[:] = out
     
-    def _find_match_positions(self, hosts_lines: List[str], config_lines: List[str]) -> List[int]:
-        """查找匹配位置"""
+    @staticmethod
+    def _join_lines(lines: List[bytes]) -> bytes:
+        """将行列表组合为完整文件内容
+
+        按总长度一次性预分配bytearray后逐行填充，避免join在
+        大文件场景下的中间临时对象，输出与b"\\n".join完全一致。
+        """
+        if not lines:
+            return b""
+
+        total = sum(len(line) for line in lines) + len(lines) - 1
+        buf = bytearray(total)
+        off = 0
+        last = len(lines) - 1
+        for i, line in enumerate(lines):
+            n = len(line)
+            buf[off:off + n] = line
+            off += n
+            if i != last:
+                buf[off] = 0x0A
+                off += 1
+        return bytes(buf)
+
+    def _find_match_positions(self, stripped_lines: List[bytes], config_lines: List[bytes]) -> List[int]:
+        """查找匹配位置
+
+        先把hosts行建成"内容 -> 行号列表"的索引，再逐行查配置数据，
+        将原来O(N·M)的嵌套扫描降为O(N+M)。
+        注意：所有注释行都作为基准行参与匹配，不跳过普通注释行；
+        两个参数都应传入已strip的行（全文件只strip一遍，由调用方算好）。
+        """
+        hosts_index = {}
+        for i, stripped in enumerate(stripped_lines):
+            if stripped:
+                hosts_index.setdefault(stripped, []).append(i)
+
         match_positions = []
-        is_hosts_monitor_data = False
-        
         for config_line in config_lines:
-            config_line = config_line.strip()
-            if not config_line:
-                continue
-                
-            # 特殊处理"# Hosts Monitor 数据"等注释行
-            if "# Hosts Monitor 数据" in config_line:
-                is_hosts_monitor_data = True
-                
-            # 所有注释行都作为基准行，不再跳过普通注释行
-            # if config_line.startswith('#') and not is_hosts_monitor_data and "# Hosts Monitor 数据" not in config_line:
-            #     continue
-                
-            for i, hosts_line in enumerate(hosts_lines):
-                hosts_line = hosts_line.strip()
-                if hosts_line == config_line:
-                    match_positions.append(i)
-        
+            match_positions.extend(hosts_index.get(config_line, ()))
+
+        # 保持与原嵌套扫描一致的行号顺序语义（后续处理以首个匹配为基准）
+        match_positions.sort()
         return match_positions
     
-    def _remove_empty_lines(self, hosts_lines: List[str], position: int) -> Tuple[int, int]:
-        """删除多余空行，确保只保留一个空行
-        
-        参数:
-            hosts_lines: hosts文件的所有行
-            position: 当前处理位置
-            
-        返回:
-            Tuple[int, int]: 处理后的位置和删除的空行数
+    def _find_block_end(self, stripped_lines: List[bytes], position: int) -> int:
+        """确定以position为起点的旧数据块的结束位置（不做任何修改）
+
+        若匹配行是注释行，则跳过其后的连续数据行（遇到空行或
+        注释行为止），再跳过块后的连续空行（由重建时统一补回
+        一个空行）。参数为调用方预先strip好的行，扫描零字符串处理。
         """
-        empty_line_count = 0
-        while position < len(hosts_lines) and not hosts_lines[position].strip():
-            empty_line_count += 1
-            del hosts_lines[position]
-            
-        # 如果需要，重新添加一个空行
-        if empty_line_count > 0 and position < len(hosts_lines):
-            hosts_lines.insert(position, "")
-            position += 1
-            
-        return position, empty_line_count
-    
-    def _process_match_position(self, hosts_lines: List[str], config_lines: List[str], position: int) -> int:
-        """处理匹配位置，删除原有内容并准备插入新内容"""
-        # 检查是否是"# Hosts Monitor 数据"标记行的匹配
-        is_comment_match = hosts_lines[position].strip().startswith('#')
-        
-        # 如果是注释行匹配，查找此注释行后的所有连续数据行并删除
-        if is_comment_match:
-            # 先删除匹配的注释行
-            del hosts_lines[position]
-            
-            # 删除匹配行后的连续非空行，直到遇到空行或注释行为止
-            while (position < len(hosts_lines) and 
-                  hosts_lines[position].strip() and 
-                  not hosts_lines[position].strip().startswith('#')):
-                del hosts_lines[position]
-                
-            # 删除所有多余空行，确保只保留一个空行
-            position, _ = self._remove_empty_lines(hosts_lines, position)
-        else:
-            # 不是注释行匹配，按原有逻辑处理
-            del hosts_lines[position]
-            
-            # 删除所有多余空行，确保只保留一个空行
-            position, _ = self._remove_empty_lines(hosts_lines, position)
-        
-        # 在匹配位置前确保有且只有一个空行
-        if position > 0:
-            # 首先删除前面所有连续的空行
-            while position > 1 and not hosts_lines[position-1].strip() and not hosts_lines[position-2].strip():
-                del hosts_lines[position-1]
-                position -= 1
-                
-            # 检查前面是否已有一个空行
-            if position > 0 and hosts_lines[position-1].strip():
-                # 如果前面不是空行，添加一个空行
-                hosts_lines.insert(position, "")
-                position += 1
-        else:
-            # 在文件开头，直接添加一个空行
-            hosts_lines.insert(0, "")
-            position += 1
-            
-        # 插入配置数据
-        for i, line in enumerate(config_lines):
-            hosts_lines.insert(position + i, line)
-            
-        # 在配置数据后确保有且只有一个空行
-        new_position = position + len(config_lines)
-        
-        # 删除可能存在的多余空行并确保只有一个空行
-        if new_position < len(hosts_lines):
-            # 使用辅助方法处理空行
-            new_position, empty_line_count = self._remove_empty_lines(hosts_lines, new_position)
-            
-            # 如果没有发现空行且不是文件末尾，添加一个空行
-            if empty_line_count == 0 and new_position < len(hosts_lines):
-                hosts_lines.insert(new_position, "")
-        else:
-            # 已到文件末尾，添加一个空行
-            hosts_lines.append("")
-            
-        return new_position
-    
+        end = position + 1
+        skip_data = stripped_lines[position].startswith(b'#')
+        while end < len(stripped_lines):
+            stripped = stripped_lines[end]
+            if not stripped:
+                # 空行终止数据块，本身也作为块后空行被跳过
+                skip_data = False
+            elif not (skip_data and not stripped.startswith(b'#')):
+                break
+            end += 1
+
+        return end
+
     def _repair_hosts_file(self, handle: int) -> bool:
         """修复hosts文件"""
         # 读取文件内容
@@ -247,70 +379,87 @@ class RepairModule:
         if not success:
             return False
         
-        # 获取配置中的hosts数据
-        config_hosts_data = config.get_hosts_data()
-        
         # 分割为行
         hosts_lines = hosts_content.splitlines()
-        config_lines = config_hosts_data.splitlines()
-        
-        # 移除配置数据中的前后空行，稍后会规范化添加
-        while config_lines and not config_lines[0].strip():
-            config_lines.pop(0)
-        while config_lines and not config_lines[-1].strip():
-            config_lines.pop()
-            
+
+        # 获取配置中的hosts数据行（带缓存，已去除前后空行）及比较形式
+        config_lines, config_match_lines = self._get_config_lines()
+
+        # 配置为空时没有需要写入的内容，直接短路返回，
+        # 不再为纯格式规范化读写hosts文件
+        if not config_lines:
+            logger.info("配置文件中没有有效的hosts数据，无需修复")
+            return True
+
+        # 全文件每行只strip一次，匹配查找与块结束扫描共用该结果
+        stripped_lines = [line.strip() for line in hosts_lines]
+
         # 查找匹配位置（包含"# Hosts Monitor 数据"等特定注释行）
-        match_positions = self._find_match_positions(hosts_lines, config_lines)
+        match_positions = self._find_match_positions(stripped_lines, config_match_lines)
         
-        # 按照修复逻辑处理
+        # 按照修复逻辑处理：三种情况统一收敛为同一条重建路径，
+        # 只在确定[基准点, 块结束)区间上有所区别
         if not match_positions:
-            # 情况1: 没有匹配项，在末尾添加
+            # 情况1: 没有匹配项，基准点取去除末尾空行后的文件末尾
             logger.info("本地hosts文件中没有匹配的数据，将在末尾添加")
-            
-            # 移除末尾的所有空行，然后添加一个空行
-            while hosts_lines and not hosts_lines[-1].strip():
-                hosts_lines.pop()
-                
-            # 确保文件有内容后添加一个空行
-            if hosts_lines:
-                hosts_lines.append("")
-            
-            # 添加配置数据
-            hosts_lines.extend(config_lines)
-            
-            # 在配置数据后添加一个空行
-            hosts_lines.append("")
-            
-        elif len(match_positions) == 1:
-            # 情况2: 只有一行匹配，以此为基准点插入
-            position = match_positions[0]
-            logger.info(f"本地hosts文件中有一行匹配的数据，在位置 {position} 处插入")
-            
-            # 处理匹配位置
-            self._process_match_position(hosts_lines, config_lines, position)
-                
+
+            start = len(hosts_lines)
+            while start and not stripped_lines[start - 1]:
+                start -= 1
+            block_end = len(hosts_lines)
+            extra_matches = set()
         else:
-            # 情况3: 有多行匹配，以第一行为基准，删除其余匹配行
-            first_match = match_positions[0]
-            logger.info(f"本地hosts文件中有多行匹配的数据，以位置 {first_match} 为基准")
-            
-            # 删除第一个匹配之后的所有匹配行
-            # 从后向前删除，避免索引问题
-            for pos in reversed(match_positions[1:]):
-                del hosts_lines[pos]
-            
-            # 处理第一个匹配位置
-            self._process_match_position(hosts_lines, config_lines, first_match)
-        
+            # 情况2/3: 以首个匹配为基准点，其余匹配行一并剔除
+            start = match_positions[0]
+            extra_matches = set(match_positions[1:])
+
+            if extra_matches:
+                logger.info("本地hosts文件中有多行匹配的数据，以位置 %s 为基准", start)
+            else:
+                logger.info("本地hosts文件中有一行匹配的数据，在位置 %s 处插入", start)
+
+            # 定位旧数据块的结束位置（不修改原列表）
+            block_end = self._find_block_end(stripped_lines, start)
+
+        # 一次性重建：基准点前内容 + 空行 + 配置数据 + 空行 + 基准点后内容
+        # 匹配位置已排序，首个匹配即最小位置，基准点之前不可能
+        # 出现其余匹配行，前段直接整体切片拷贝，无需逐行判断
+        new_lines = hosts_lines[:start]
+        if new_lines:
+            new_lines.append(b"")
+        new_lines.extend(config_lines)
+        new_lines.append(b"")
+        new_lines.extend(
+            line
+            for i, line in enumerate(hosts_lines[block_end:], start=block_end)
+            if i not in extra_matches
+        )
+        hosts_lines = new_lines
+
         # 处理文件末尾和确保整个文件中不存在连续的空行
         self._ensure_single_empty_lines(hosts_lines)
-        
-        # 将行组合成文本
-        new_content = "\n".join(hosts_lines)
-        
+
+        # 将行组合成字节内容（预分配精确大小的缓冲区，一次分配完成）
+        new_content = self._join_lines(hosts_lines)
+
+        # 内容未变化时跳过写入：免去SetEndOfFile/WriteFile/FlushFileBuffers
+        # （Windows上有杀毒驱动介入时这才是真正的开销所在）
+        if (hashlib.blake2b(new_content, digest_size=16).digest()
+                == hashlib.blake2b(hosts_content, digest_size=16).digest()):
+            logger.info("hosts文件内容已符合预期，无需写入")
+            monitor.update_known_digest(new_content)
+            return True
+
+        # 只写入从首个差异字节开始的尾部：典型修复只改动文件中
+        # 一小段，公共前缀部分无需重复推入文件系统缓存
+        prefix_len = self._common_prefix_len(new_content, hosts_content)
+
         # 写入文件
-        return self._write_file_content(handle, new_content)
+        if self._write_file_content(handle, new_content, start=prefix_len):
+            # 登记写入后的内容摘要，让监控识别本次自触发的变化事件
+            monitor.update_known_digest(new_content)
+            return True
+        return False
     
     def _repair_process(self) -> None:
         """修复处理过程"""
@@ -328,51 +477,99 @@ class RepairModule:
             delay_time_ms = config.get("general", "delay_time", 3000)
             delay_time_sec = delay_time_ms / 1000.0
             
-            # 等待延迟时间
+            # 等待延迟时间（可被停止事件打断，退出时不再阻塞整个延迟）
             logger.info(f"等待延迟时间: {delay_time_ms}毫秒 ({delay_time_sec:.2f}秒)")
-            time.sleep(delay_time_sec)
-            
+            if self._stop_event.wait(delay_time_sec):
+                logger.info("修复模块收到停止信号，取消本次修复")
+                return
+
+            # 延迟期间到达的触发指向的变更本次读取即可覆盖，
+            # 清空队列将其并入本次修复，避免紧随其后的重复修复
+            self._drain_pending()
+
             # 获取hosts文件路径
             hosts_path = monitor.get_hosts_path()
-            
+
+            # hosts与配置自上次成功修复后都未变化时直接返回，
+            # 省去取写句柄（及其共享冲突风险）和整个读取比对流程
+            state = self._current_state(hosts_path)
+            if state is not None and state == self._last_repair_state:
+                logger.info("hosts文件与配置自上次修复后均未变化，跳过修复")
+                return
+
             # 获取文件写入权限
             success, handle = self._get_write_access(hosts_path)
             if not success:
                 logger.error("无法获取hosts文件写入权限，修复失败")
                 return
             
+            repaired = False
             try:
                 # 修复hosts文件
                 if self._repair_hosts_file(handle):
+                    repaired = True
                     logger.info("hosts文件修复成功")
                 else:
                     logger.error("hosts文件修复失败")
             finally:
                 # 释放文件写入权限
                 self._release_write_access(handle)
+
+            # 仅在修复成功后记录快照（失败时保持为空以便下次重试），
+            # 且在句柄释放后再记录，此时mtime已反映本次写入
+            if repaired:
+                self._last_repair_state = self._current_state(hosts_path)
         
         except Exception as e:
             logger.error(f"修复过程中发生错误: {str(e)}")
         finally:
             logger.info("修复模块关闭")
     
-    def _is_admin(self) -> bool:
-        """检查是否以管理员权限运行"""
+    def _current_state(self, hosts_path: str) -> Optional[Tuple[int, int, int]]:
+        """获取(hosts文件mtime, 配置文件mtime, 配置版本号)快照，失败返回None"""
         try:
-            from .utils import is_admin
-            return is_admin()
-        except Exception as e:
-            logger.error(f"检查管理员权限时出错: {str(e)}")
-            return False
+            return (
+                os.stat(hosts_path).st_mtime_ns,
+                os.stat(config.config_path).st_mtime_ns,
+                config.data_version,
+            )
+        except OSError:
+            return None
+
+    def _is_admin(self) -> bool:
+        """检查是否以管理员权限运行（结果在进程内缓存）"""
+        if RepairModule._is_admin_cache is None:
+            try:
+                from .utils import is_admin
+                RepairModule._is_admin_cache = is_admin()
+            except Exception as e:
+                logger.error(f"检查管理员权限时出错: {str(e)}")
+                RepairModule._is_admin_cache = False
+        return RepairModule._is_admin_cache
                 
     def start(self) -> None:
-        """启动修复模块"""
-        if self.repair_thread and self.repair_thread.is_alive():
-            logger.warning("修复模块已在运行中")
+        """提交一次修复请求
+
+        请求投递到常驻工作线程的队列中；若已有待处理的请求，
+        新请求与之合并（队列容量为1），天然对连续触发去重。
+        """
+        if self._stop_event.is_set():
+            logger.debug("修复模块已停止，忽略修复请求")
             return
-        
-        self.repair_thread = threading.Thread(target=self._repair_process)
-        self.repair_thread.start()
+
+        try:
+            self._repair_queue.put_nowait(True)
+        except queue.Full:
+            logger.debug("已有待处理的修复请求，本次触发合并处理")
+
+    def stop(self) -> None:
+        """停止修复模块
+
+        置位停止事件：延迟等待中的修复会立即取消，后续触发被忽略。
+        工作线程为daemon线程，无需join。
+        """
+        self._stop_event.set()
+        logger.info("修复模块已停止")
 
 
 # 全局修复模块对象
@@ -5,9 +5,12 @@ UI模块
 - 软件界面分为上中下三栏
 """
 
+import collections
 import os
+import re
 import sys
-from typing import TYPE_CHECKING, cast
+import threading
+from typing import TYPE_CHECKING, Optional
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -16,8 +19,8 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QPushButton,
     QCheckBox,
-    QLineEdit,
-    QTextEdit,
+    QSpinBox,
+    QPlainTextEdit,
     QLabel,
     QMessageBox,
     QSystemTrayIcon,
@@ -25,7 +28,7 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QFrame,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QByteArray, QTimer
 from PyQt6.QtCore import QObject  # 用于信号的类型注解
 from PyQt6.QtGui import (
     QIcon,
@@ -34,32 +37,24 @@ from PyQt6.QtGui import (
     QResizeEvent,
     QMoveEvent,
     QShowEvent,
+    QHideEvent,
+    QCursor,
     QFont,
-    QIntValidator,
+    QTextCharFormat,
+    QTextCursor,
     QPalette,
     QColor,
 )
 
-# 添加 QAction.triggered 信号的类型提示
-if TYPE_CHECKING:
-    QAction.triggered = PyQtSignalInstance()  # type: ignore
-
 # 为IDE提供类型信息
 if TYPE_CHECKING:
     # 这段代码只在类型检查时被处理，不会在运行时执行
-    from PyQt6.QtCore import pyqtBoundSignal, pyqtSignal as PyQtSignal
-    from typing import Callable, Any
-
-    # 为QAction.triggered创建类型别名
-    class PyQtSignalInstance:
-        def connect(self, slot: Callable[..., Any]) -> None: ...
-        def disconnect(self, slot: Callable[..., Any] = None) -> None: ...
-        def emit(self, *args) -> None: ...
+    from PyQt6.QtCore import pyqtSignal as PyQtSignal
 
 
-# 相对导入将在条件判断后处理
 # 初始化日志和版本信息
-# 支持直接运行UI时的导入方式
+# 支持直接运行UI时的导入方式：正常作为包导入走相对导入快路径，
+# 直接运行时只补齐sys.path后按包路径导入一次，不再级联多层回退
 try:
     # 尝试相对导入（作为包的一部分导入时）
     from . import logger
@@ -68,96 +63,93 @@ try:
     from .monitor import monitor
     from .contrast import contrast_module
     from .repair import repair_module
-
-    # 避免循环导入
-    # 通过延迟导入controller来避免循环导入问题
-    controller = None
 except ImportError:
-    # 当直接运行UI模块时的导入方式
-    import sys
-    import importlib.util
-    import os
-
-    # 确定模块路径
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.dirname(current_dir)
-
-    # 将父目录添加到sys.path
+    # 当直接运行UI模块时，把项目根目录加入sys.path后按包导入
+    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     if parent_dir not in sys.path:
         sys.path.insert(0, parent_dir)
 
-    # 确保hosts_monitor包可以被识别
-    if current_dir not in sys.path:
-        sys.path.insert(0, current_dir)
-
-    # 先尝试从包中导入
-    try:
-        from hosts_monitor import (
-            logger,
-            config,
-            monitor,
-            contrast_module,
-            repair_module,
-        )
-        from hosts_monitor.version import VERSION, APP_NAME
+    from hosts_monitor import (
+        logger,
+        config,
+        monitor,
+        contrast_module,
+        repair_module,
+    )
+    from hosts_monitor.version import VERSION, APP_NAME
 
-        try:
-            from hosts_monitor.controller import controller
-        except ImportError:
-            # 创建一个控制器模拟实现
-            print("警告: 控制器模块未找到，将使用模拟实现")
-
-            class DummyController:
-                def __init__(self):
-                    pass
-
-                def start(self):
-                    print("使用模拟控制器启动应用程序")
-
-                def stop(self):
-                    print("使用模拟控制器停止应用程序")
-
-            controller = DummyController()
-    except ImportError:
-        # 如果无法从包导入，尝试直接导入
-        print("尝试直接导入模块...")
-        sys.path.insert(0, os.path.join(parent_dir, "hosts_monitor"))
-        try:
-            import logger
-            import config
-            import monitor
-            import version
-            import contrast
-            import repair
-
-            # 获取需要的模块和变量
-            VERSION = version.VERSION
-            APP_NAME = version.APP_NAME
-            contrast_module = contrast.contrast_module
-            repair_module = repair.repair_module
+# 避免循环导入：controller由connect_signals延迟导入
+controller = None
 
-            try:
-                import controller
 
-                controller = controller.controller
-            except ImportError:
-                print("警告: 控制器模块未找到，将使用模拟实现")
+# 日志着色关键词表与对应颜色：模块加载时编译一次的正则交替，
+# 每条日志只扫描一遍字符串，取代逐关键词的多次子串查找
+_LEVEL_COLORS = {
+    "错误": "#e74c3c",
+    "失败": "#e74c3c",
+    "警告": "#e67e22",
+    "成功": "#27ae60",
+    "已保存": "#27ae60",
+    "信息": "#2980b9",
+    "提示": "#2980b9",
+}
+_LEVEL_RE = re.compile("|".join(map(re.escape, _LEVEL_COLORS)))
 
-                # 提供一个模拟实现
-                class DummyController:
-                    def __init__(self):
-                        pass
 
-                    def start(self):
-                        print("使用模拟控制器启动应用程序")
+# 窗口调色板颜色与全局字体：模块加载时构建一次，
+# 避免每次窗口实例化重复解析/构造同样的值对象
+_WINDOW_BG = QColor(245, 245, 248)
+_WINDOW_FG = QColor(30, 30, 30)
+_APP_FONT = QFont("Microsoft YaHei UI", 9)  # 微软雅黑UI字体
 
-                    def stop(self):
-                        print("使用模拟控制器停止应用程序")
 
-                controller = DummyController()
-        except Exception as e:
-            print(f"导入模块时发生错误: {str(e)}")
-            raise
+# 全局滚动条样式：模块加载时构建一次的冻结字符串，
+# 每个窗口实例复用同一对象，避免构造时重复拼接大段QSS
+_SCROLLBAR_QSS = """
+            QScrollBar:vertical {
+                background-color: #f0f0f0;
+                width: 12px;
+                margin: 0px 0px 0px 0px;
+                border-radius: 6px;
+            }
+            QScrollBar::handle:vertical {
+                background-color: #c0c0c0;
+                min-height: 30px;
+                border-radius: 6px;
+            }
+            QScrollBar::handle:vertical:hover {
+                background-color: #a0a0a0;
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                height: 0px;
+            }
+            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+                background-color: #f0f0f0;
+                border-radius: 6px;
+            }
+            
+            QScrollBar:horizontal {
+                background-color: #f0f0f0;
+                height: 12px;
+                margin: 0px 0px 0px 0px;
+                border-radius: 6px;
+            }
+            QScrollBar::handle:horizontal {
+                background-color: #c0c0c0;
+                min-width: 30px;
+                border-radius: 6px;
+            }
+            QScrollBar::handle:horizontal:hover {
+                background-color: #a0a0a0;
+            }
+            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+                width: 0px;
+            }
+            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+                background-color: #f0f0f0;
+                border-radius: 6px;
+            }
+        """
 
 
 class HostsMonitorUI(QMainWindow):
@@ -166,36 +158,37 @@ class HostsMonitorUI(QMainWindow):
     # 布局常量
     TOP_GROUP_HEIGHT = 130  # 顶部控制面板固定高度
 
-    # 样式常量
-    STYLE_GROUP_BOX = (
-        "QGroupBox { font-weight: bold; border: 1px solid #cccccc; border-radius: 6px; margin-top: 10px; } "
-        "QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }"
-    )
+    # 统一样式表：所有控件样式通过objectName选择器集中在一张QSS中，
+    # 由主窗口一次性安装，避免逐控件setStyleSheet引发的多次解析与polish
+    STYLE_WIDGETS = """
+        QGroupBox { font-weight: bold; border: 1px solid #cccccc; border-radius: 6px; margin-top: 10px; }
+        QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
 
-    STYLE_TITLE_LABEL = "font-weight: bold; color: #444444;"
+        QLabel#titleLabel { font-weight: bold; color: #444444; }
+        QLabel#monitorStatusLabel { padding: 5px; border: 1px solid #cccccc; border-radius: 4px; background-color: #f9f9f9; }
 
-    STYLE_NORMAL_BUTTON = (
-        "QPushButton { background-color: #f0f0f0; border: 1px solid #cccccc; border-radius: 4px; padding: 5px; } "
-        "QPushButton:hover { background-color: #e6e6e6; } "
-        "QPushButton:pressed { background-color: #d9d9d9; }"
-    )
+        QPushButton#openHostsBtn, QPushButton#applyDelayBtn { background-color: #f0f0f0; border: 1px solid #cccccc; border-radius: 4px; padding: 5px; }
+        QPushButton#openHostsBtn:hover, QPushButton#applyDelayBtn:hover { background-color: #e6e6e6; }
+        QPushButton#openHostsBtn:pressed, QPushButton#applyDelayBtn:pressed { background-color: #d9d9d9; }
 
-    STYLE_PRIMARY_BUTTON = (
-        "QPushButton { background-color: #0078d7; color: white; border-radius: 4px; padding: 5px; } "
-        "QPushButton:hover { background-color: #1084e0; } "
-        "QPushButton:pressed { background-color: #005fa1; } "
-        "QPushButton:disabled { background-color: #88b7df; }"
-    )
+        QPushButton#adminBtn, QPushButton#saveBtn { background-color: #0078d7; color: white; border-radius: 4px; padding: 5px; }
+        QPushButton#adminBtn:hover, QPushButton#saveBtn:hover { background-color: #1084e0; }
+        QPushButton#adminBtn:pressed, QPushButton#saveBtn:pressed { background-color: #005fa1; }
+        QPushButton#adminBtn:disabled, QPushButton#saveBtn:disabled { background-color: #88b7df; }
 
-    STYLE_SUCCESS_BUTTON = (
-        "QPushButton { background-color: #5cb85c; color: white; border-radius: 4px; padding: 5px; } "
-        "QPushButton:hover { background-color: #4cae4c; } "
-        "QPushButton:pressed { background-color: #3d8b3d; }"
-    )
+        QPushButton#manualCheckBtn { background-color: #5cb85c; color: white; border-radius: 4px; padding: 5px; }
+        QPushButton#manualCheckBtn:hover { background-color: #4cae4c; }
+        QPushButton#manualCheckBtn:pressed { background-color: #3d8b3d; }
 
-    STYLE_STATUS_LABEL = "padding: 5px; border: 1px solid #cccccc; border-radius: 4px; background-color: #f9f9f9;"
+        QSpinBox#delayEdit { border: 1px solid #cccccc; border-radius: 4px; padding: 3px; }
+        QPlainTextEdit#hostsEdit { border: 1px solid #cccccc; border-radius: 4px; background-color: #ffffff; }
+        QPlainTextEdit#logView { border: 1px solid #cccccc; border-radius: 4px; background-color: #f5f5f5; }
+        QFrame#vSeparator { background-color: #cccccc; }
 
-    STYLE_EDIT_BOX = "border: 1px solid #cccccc; border-radius: 4px; padding: 3px;"
+        QMenu { background-color: #ffffff; border: 1px solid #cccccc; }
+        QMenu::item { padding: 5px 25px 5px 30px; }
+        QMenu::item:selected { background-color: #e6f2ff; }
+    """
 
     # 信号定义
     if TYPE_CHECKING:
@@ -204,34 +197,42 @@ class HostsMonitorUI(QMainWindow):
         config_saved: PyQtSignal
         monitor_status_changed: PyQtSignal
         ui_initialized: PyQtSignal
+        autostart_state_ready: PyQtSignal
+        autostart_toggle_done: PyQtSignal
     else:
         log_updated = pyqtSignal(str)
         admin_status_changed = pyqtSignal(bool)
         config_saved = pyqtSignal()
         monitor_status_changed = pyqtSignal(bool)
         ui_initialized = pyqtSignal()  # 新增UI初始化完成信号
+        autostart_state_ready = pyqtSignal(bool)  # 后台自启状态查询完成
+        autostart_toggle_done = pyqtSignal(bool, bool)  # 后台自启切换完成(成功, 目标状态)
+
+    # 监控状态标签的两种样式：类加载时冻结，状态切换时直接复用，
+    # 免去每次状态变化的字符串拼接，Qt也能复用已解析的样式缓存
+    _STYLE_STATUS_ACTIVE = (
+        "padding: 5px; border: 1px solid #c3e6cb; "
+        "border-radius: 4px; background-color: #d4edda; "
+        "color: #155724; font-weight: bold;"
+    )
+    _STYLE_STATUS_INACTIVE = (
+        "padding: 5px; border: 1px solid #f5c6cb; "
+        "border-radius: 4px; background-color: #f8d7da; "
+        "color: #721c24; font-weight: bold;"
+    )
 
     def apply_status_style(self, widget, is_active: bool) -> None:
         """应用状态样式到控件"""
-        if is_active:
-            widget.setStyleSheet(
-                "padding: 5px; border: 1px solid #c3e6cb; "
-                "border-radius: 4px; background-color: #d4edda; "
-                "color: #155724; font-weight: bold;"
-            )
-        else:
-            widget.setStyleSheet(
-                "padding: 5px; border: 1px solid #f5c6cb; "
-                "border-radius: 4px; background-color: #f8d7da; "
-                "color: #721c24; font-weight: bold;"
-            )
+        widget.setStyleSheet(
+            self._STYLE_STATUS_ACTIVE if is_active else self._STYLE_STATUS_INACTIVE
+        )
 
     def create_vertical_separator(self) -> QFrame:
         """创建垂直分隔线"""
         separator = QFrame()
+        separator.setObjectName("vSeparator")
         separator.setFrameShape(QFrame.Shape.VLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        separator.setStyleSheet("background-color: #cccccc;")
         return separator
 
     def __init__(self):
@@ -240,7 +241,9 @@ class HostsMonitorUI(QMainWindow):
         # 窗口标题和图标
         self.setWindowTitle(f"{APP_NAME} v{VERSION}")
         self.icon_path = self._get_icon_path()
-        self.setWindowIcon(QIcon(self.icon_path))
+        # 图标只从磁盘解码一次，窗口/托盘/菜单各处复用同一QIcon实例
+        self._icon = QIcon(self.icon_path)
+        self.setWindowIcon(self._icon)
 
         # 设置窗口标志，使其最小化时只在系统托盘显示
         self.setWindowFlags(self.windowFlags() | Qt.WindowType.Tool)
@@ -255,10 +258,45 @@ class HostsMonitorUI(QMainWindow):
         # 监控状态
         self.is_monitoring = False
 
+        # 最近一次发射的监控状态：只在状态真正翻转时发信号，
+        # 避免重复的setText/setStyleSheet触发无意义的样式重抛光
+        self._last_emitted_monitor_state = None
+
+        # 管理员权限在进程生命周期内不会变化，查询结果缓存一次；
+        # 首次查询由_post_init的权限检查触发，构造路径不做Win32调用
+        self._is_admin_cache: Optional[bool] = None
+
+        # 日志合并缓冲：日志信号只入缓冲，由50毫秒单次定时器统一刷入
+        # 视图，把突发的N次文档更新合并为一次，避免重绘串行拖慢事件循环。
+        # 上限与视图块数一致：极端日志风暴下缓冲不会无界增长，
+        # 超出的最旧条目直接丢弃（它们本来也会被视图的块数上限滚掉）
+        self._log_buf = collections.deque(maxlen=5000)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+
+        # 窗口几何防抖保存：拖拽/缩放停止500毫秒后才落盘一次，
+        # 既避免拖动过程中的频繁写盘，又保证异常退出时几何不丢失
+        self._geom_save_timer = QTimer(self)
+        self._geom_save_timer.setSingleShot(True)
+        self._geom_save_timer.setInterval(500)
+        self._geom_save_timer.timeout.connect(self.save_window_geometry)
+
+        # 日志环形缓冲：工作线程只做一次deque.append（CPython下线程安全，
+        # 无锁无事件投递），由GUI线程的周期定时器批量取走。相比每条日志
+        # 一次跨线程信号排队（堆分配+事件循环post），高频日志的提交开销
+        # 大幅摊薄；定时器仅在窗口可见时运行
+        self._log_ring = collections.deque(maxlen=5000)
+        self._log_drain_timer = QTimer(self)
+        self._log_drain_timer.setInterval(33)
+        self._log_drain_timer.timeout.connect(self._drain_log_ring)
+
+        # 延迟时间（毫秒）在构造时读取一次并缓存，各处复用
+        self._delay_time_ms = int(config.get("general", "delay_time", 3000))
+
         # 初始化监控模块的去抖动时间（毫秒转秒）
-        delay_time_ms = config.get("general", "delay_time", 3000)
-        debounce_time_sec = delay_time_ms / 1000.0
-        monitor.set_debounce_time(debounce_time_sec)
+        monitor.set_debounce_time(self._delay_time_ms / 1000.0)
 
         # 系统托盘
         self.setup_tray_icon()
@@ -267,75 +305,71 @@ class HostsMonitorUI(QMainWindow):
         self.setup_ui()  # 连接信号
         self.connect_signals()
 
+        # 构造完成后统一执行延迟初始化：单个持久定时器替代
+        # 原来100/500/1000毫秒的三个singleShot，减少定时器分配
+        # 和事件循环往返，也消除启动检查之间的人为延迟。
+        # 持久成员而非QTimer.singleShot：后者每次调用都会在内部
+        # 新建并销毁一个临时QTimer对象
+        self._boot_timer = QTimer(self)
+        self._boot_timer.setSingleShot(True)
+        self._boot_timer.timeout.connect(self._post_init)
+        self._boot_timer.start(0)
+
+    @pyqtSlot()
+    def _post_init(self) -> None:
+        """事件循环启动后的统一延迟初始化"""
+        # 发送UI初始化完成信号
+        self.ui_initialized.emit()
+
         # 检查管理员权限
-        QTimer.singleShot(500, self.check_admin_privileges)
+        self.check_admin_privileges()
 
-        # 检查监控状态
-        QTimer.singleShot(1000, self.check_monitor_status)
+        # 查询一次初始监控状态，后续变化由监控模块边沿通知推送
+        self.check_monitor_status()
 
-        # 发送UI初始化完成信号
-        QTimer.singleShot(100, self.ui_initialized.emit)
+        # 校准开机自启复选框为系统实际状态（构造时只用了配置值）
+        self._refresh_autostart_state()
+
+    def _refresh_autostart_state(self) -> None:
+        """在后台线程查询系统实际自启状态，结果经信号送回GUI线程
+
+        任务计划/注册表查询可能耗时数百毫秒，放在GUI线程会卡顿；
+        工作线程只发信号，跨线程信号由Qt排队投递到GUI线程执行。
+        """
+
+        def query() -> None:
+            try:
+                from .utils import check_autostart
+
+                self.autostart_state_ready.emit(check_autostart())
+            except Exception as e:
+                logger.error(f"检查开机自启状态失败: {str(e)}")
+
+        threading.Thread(target=query, daemon=True).start()
+
+    @pyqtSlot(bool)
+    def _apply_autostart_state(self, autostart_status: bool) -> None:
+        """将后台查询到的自启状态校准到复选框（不触发toggle信号）"""
+        if autostart_status != self.autostart_cb.isChecked():
+            self.autostart_cb.blockSignals(True)
+            self.autostart_cb.setChecked(autostart_status)
+            self.autostart_cb.blockSignals(False)
 
     def setup_window_style(self) -> None:
         """设置窗口样式"""
-        # 设置应用程序全局字体
-        app_font = QFont("Microsoft YaHei UI", 9)  # 使用微软雅黑UI字体
-        QApplication.setFont(app_font)
+        # 设置应用程序全局字体（模块级常量）
+        QApplication.setFont(_APP_FONT)
 
-        # 设置窗口背景色为浅色
+        # 设置窗口背景色为浅色（QColor常量模块加载时已构建）
         palette = self.palette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(245, 245, 248))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(30, 30, 30))
+        palette.setColor(QPalette.ColorRole.Window, _WINDOW_BG)
+        palette.setColor(QPalette.ColorRole.WindowText, _WINDOW_FG)
         self.setPalette(palette)
 
-        # 设置全局滚动条样式
-        self.setStyleSheet(
-            """
-            QScrollBar:vertical {
-                background-color: #f0f0f0;
-                width: 12px;
-                margin: 0px 0px 0px 0px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #c0c0c0;
-                min-height: 30px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #a0a0a0;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background-color: #f0f0f0;
-                border-radius: 6px;
-            }
-            
-            QScrollBar:horizontal {
-                background-color: #f0f0f0;
-                height: 12px;
-                margin: 0px 0px 0px 0px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: #c0c0c0;
-                min-width: 30px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: #a0a0a0;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
-                background-color: #f0f0f0;
-                border-radius: 6px;
-            }
-        """
-        )
+        # 设置全局滚动条样式与统一控件样式（常量在模块加载时一次构建）。
+        # 装在QApplication上而不是主窗口上：托盘菜单等非窗口子级控件
+        # 也能命中同一张表，整个应用只有一次QSS解析与polish
+        QApplication.instance().setStyleSheet(_SCROLLBAR_QSS + self.STYLE_WIDGETS)
 
     def _get_icon_path(self) -> str:
         """获取图标路径，如果是打包环境且本地没有图标文件则释放"""
@@ -371,70 +405,75 @@ class HostsMonitorUI(QMainWindow):
         return icon_path
 
     def setup_tray_icon(self) -> None:
-        """设置系统托盘图标"""
+        """设置系统托盘图标（菜单延迟到首次使用托盘时才构建）"""
         self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(QIcon(self.icon_path))
+        self.tray_icon.setIcon(self._icon)
         self.tray_icon.setToolTip(f"{APP_NAME} v{VERSION}")
 
-        # 托盘菜单
-        tray_menu = QMenu()
-        tray_menu.setStyleSheet(
-            "QMenu { background-color: #ffffff; border: 1px solid #cccccc; }"
-            "QMenu::item { padding: 5px 25px 5px 30px; }"
-            "QMenu::item:selected { background-color: #e6f2ff; }"
-        )
-
-        show_action = QAction(QIcon(self.icon_path), "显示主窗口", self)
-        # 使用cast消除类型检查警告
-        if TYPE_CHECKING:
-            cast(PyQtSignalInstance, show_action.triggered).connect(
-                self.show_main_window
-            )
-        else:
-            show_action.triggered.connect(self.show_main_window)
-        tray_menu.addAction(show_action)
-
-        manual_check_action = QAction("手动对比", self)
-        # 使用cast消除类型检查警告
-        if TYPE_CHECKING:
-            cast(PyQtSignalInstance, manual_check_action.triggered).connect(
-                self.manual_contrast
-            )
-        else:
-            manual_check_action.triggered.connect(self.manual_contrast)
-        tray_menu.addAction(manual_check_action)
-
-        tray_menu.addSeparator()
-
-        exit_action = QAction("退出", self)
-        # 使用cast消除类型检查警告
-        if TYPE_CHECKING:
-            cast(PyQtSignalInstance, exit_action.triggered).connect(
-                self.quit_application
-            )
-        else:
-            exit_action.triggered.connect(self.quit_application)
-        tray_menu.addAction(exit_action)
+        # 托盘菜单按需构建：多数启动场景用户从不右键托盘，
+        # 菜单和动作的构造成本从冷启动路径上移除
+        self._tray_menu = None
 
-        self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.activated.connect(self.tray_icon_activated)
 
         # 显示托盘图标
         self.tray_icon.show()
 
         # 使用定时器延迟确保托盘图标显示
-        # 解决在某些情况下托盘图标不显示的问题
-        QTimer.singleShot(500, self.tray_icon.show)
+        # 解决在某些情况下托盘图标不显示的问题；仅在确实未显示时才补一次show
+        QTimer.singleShot(
+            500,
+            lambda: None if self.tray_icon.isVisible() else self.tray_icon.show(),
+        )
 
+    @pyqtSlot()
     def show_main_window(self) -> None:
         """显示主窗口"""
         self.show()
         self.raise_()
         self.activateWindow()
 
+    def _ensure_tray_menu(self) -> bool:
+        """首次需要时构建托盘菜单
+
+        返回:
+            bool: 本次调用是否刚完成构建
+        """
+        if self._tray_menu is not None:
+            return False
+
+        # 托盘菜单（样式由应用级统一样式表中的QMenu规则提供）
+        tray_menu = QMenu()
+
+        # 菜单项不再挂图标装饰：托盘本身已显示应用图标，菜单里重复
+        # 渲染同一图标只增加绘制成本
+        show_action = QAction("显示主窗口", self)
+        show_action.triggered.connect(self.show_main_window)
+        tray_menu.addAction(show_action)
+
+        manual_check_action = QAction("手动对比", self)
+        manual_check_action.triggered.connect(self.manual_contrast)
+        tray_menu.addAction(manual_check_action)
+
+        tray_menu.addSeparator()
+
+        exit_action = QAction("退出", self)
+        exit_action.triggered.connect(self.quit_application)
+        tray_menu.addAction(exit_action)
+
+        self.tray_icon.setContextMenu(tray_menu)
+        self._tray_menu = tray_menu
+        return True
+
+    @pyqtSlot(QSystemTrayIcon.ActivationReason)
     def tray_icon_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
         """托盘图标被激活"""
-        if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
+        # 首次激活时补建菜单；若本次就是右键请求，Qt在setContextMenu
+        # 之前已决定不弹出，这里手动弹出一次补上
+        built_now = self._ensure_tray_menu()
+        if reason == QSystemTrayIcon.ActivationReason.Context and built_now:
+            self._tray_menu.popup(QCursor.pos())
+        elif reason == QSystemTrayIcon.ActivationReason.DoubleClick:
             self.show_main_window()
 
     def setup_ui(self) -> None:
@@ -451,7 +490,8 @@ class HostsMonitorUI(QMainWindow):
         # 上栏 - 控制面板
         top_group = QGroupBox("控制面板")
         top_group.setObjectName("topGroup")
-        top_group.setStyleSheet(self.STYLE_GROUP_BOX)
+        # 缓存引用供adjust_layout_heights直接使用，免去每次缩放的findChild遍历
+        self._top_group = top_group
         top_layout = QVBoxLayout(top_group)
         top_layout.setContentsMargins(10, 20, 10, 10)
 
@@ -462,37 +502,22 @@ class HostsMonitorUI(QMainWindow):
         admin_layout = QVBoxLayout()
         admin_layout.setSpacing(5)
         admin_title = QLabel("权限控制")
-        admin_title.setStyleSheet(self.STYLE_TITLE_LABEL)
+        admin_title.setObjectName("titleLabel")
         admin_layout.addWidget(admin_title)
 
         self.admin_btn = QPushButton("以管理员权限运行")
+        self.admin_btn.setObjectName("adminBtn")
         self.admin_btn.setMinimumWidth(150)
-        self.admin_btn.setStyleSheet(self.STYLE_PRIMARY_BUTTON)
-        # 使用cast消除类型检查警告
-        if TYPE_CHECKING:
-            cast(PyQtSignalInstance, self.admin_btn.clicked).connect(self.run_as_admin)
-        else:
-            self.admin_btn.clicked.connect(self.run_as_admin)
+        self.admin_btn.clicked.connect(self.run_as_admin)
         admin_layout.addWidget(self.admin_btn)
 
-        # 导入工具函数检查自启动状态
-        try:
-            from .utils import check_autostart
-
-            autostart_status = check_autostart()
-        except Exception as e:
-            logger.error(f"检查开机自启状态失败: {str(e)}")
-            autostart_status = config.get("general", "auto_start", False)
+        # 先用配置值初始化复选框；真实系统状态的查询（任务计划/注册表）
+        # 延后到_post_init执行，避免拖慢窗口构造与首次绘制
+        autostart_status = config.get("general", "auto_start", False)
 
         self.autostart_cb = QCheckBox("开机自启")
         self.autostart_cb.setChecked(autostart_status)
-        # 使用cast消除类型检查警告
-        if TYPE_CHECKING:
-            cast(PyQtSignalInstance, self.autostart_cb.stateChanged).connect(
-                self.toggle_autostart
-            )
-        else:
-            self.autostart_cb.stateChanged.connect(self.toggle_autostart)
+        self.autostart_cb.stateChanged.connect(self.toggle_autostart)
         admin_layout.addWidget(self.autostart_cb)
         top_row1.addLayout(admin_layout)
 
@@ -503,23 +528,17 @@ class HostsMonitorUI(QMainWindow):
         file_layout = QVBoxLayout()
         file_layout.setSpacing(5)
         file_title = QLabel("文件操作")
-        file_title.setStyleSheet(self.STYLE_TITLE_LABEL)
+        file_title.setObjectName("titleLabel")
         file_layout.addWidget(file_title)
 
         self.open_hosts_btn = QPushButton("打开hosts文件")
-        self.open_hosts_btn.setStyleSheet(self.STYLE_NORMAL_BUTTON)
-        # 使用cast消除类型检查警告
-        if TYPE_CHECKING:
-            cast(PyQtSignalInstance, self.open_hosts_btn.clicked).connect(
-                self.open_hosts_file
-            )
-        else:
-            self.open_hosts_btn.clicked.connect(self.open_hosts_file)
+        self.open_hosts_btn.setObjectName("openHostsBtn")
+        self.open_hosts_btn.clicked.connect(self.open_hosts_file)
         file_layout.addWidget(self.open_hosts_btn)
 
         # 监控状态指示
         self.monitor_status_label = QLabel("监控状态: 未知")
-        self.monitor_status_label.setStyleSheet(self.STYLE_STATUS_LABEL)
+        self.monitor_status_label.setObjectName("monitorStatusLabel")
         file_layout.addWidget(self.monitor_status_label)
 
         top_row1.addLayout(file_layout)
@@ -531,42 +550,31 @@ class HostsMonitorUI(QMainWindow):
         operation_layout = QVBoxLayout()
         operation_layout.setSpacing(5)
         operation_title = QLabel("操作与设置")
-        operation_title.setStyleSheet(self.STYLE_TITLE_LABEL)
+        operation_title.setObjectName("titleLabel")
         operation_layout.addWidget(operation_title)
 
         # 手动对比按钮
         self.manual_check_btn = QPushButton("手动对比")
-        self.manual_check_btn.setStyleSheet(self.STYLE_SUCCESS_BUTTON)
-        # 使用cast消除类型检查警告
-        if TYPE_CHECKING:
-            cast(PyQtSignalInstance, self.manual_check_btn.clicked).connect(
-                self.manual_contrast
-            )
-        else:
-            self.manual_check_btn.clicked.connect(self.manual_contrast)
+        self.manual_check_btn.setObjectName("manualCheckBtn")
+        self.manual_check_btn.clicked.connect(self.manual_contrast)
         operation_layout.addWidget(self.manual_check_btn)
 
         # 延迟设置
         delay_layout = QHBoxLayout()
         delay_layout.addWidget(QLabel("延迟时间(毫秒):"))
 
-        self.delay_edit = QLineEdit()
+        # 数字输入框自带范围约束，读取时无需再做解析和钳位
+        self.delay_edit = QSpinBox()
+        self.delay_edit.setObjectName("delayEdit")
         self.delay_edit.setFixedWidth(80)
-        self.delay_edit.setStyleSheet(self.STYLE_EDIT_BOX)
-        self.delay_edit.setText(str(config.get("general", "delay_time", 3000)))
-        self.delay_edit.setValidator(QIntValidator(1, 10000))
+        self.delay_edit.setRange(1, 10000)
+        self.delay_edit.setValue(self._delay_time_ms)
         delay_layout.addWidget(self.delay_edit)
 
         self.apply_delay_btn = QPushButton("应用")
         self.apply_delay_btn.setToolTip("应用延迟时间设置")
-        self.apply_delay_btn.setStyleSheet(self.STYLE_NORMAL_BUTTON)
-        # 使用cast消除类型检查警告
-        if TYPE_CHECKING:
-            cast(PyQtSignalInstance, self.apply_delay_btn.clicked).connect(
-                self.apply_delay_time
-            )
-        else:
-            self.apply_delay_btn.clicked.connect(self.apply_delay_time)
+        self.apply_delay_btn.setObjectName("applyDelayBtn")
+        self.apply_delay_btn.clicked.connect(self.apply_delay_time)
         delay_layout.addWidget(self.apply_delay_btn)
 
         operation_layout.addLayout(delay_layout)
@@ -583,30 +591,30 @@ class HostsMonitorUI(QMainWindow):
         # 中栏 - hosts数据
         middle_group = QGroupBox("Hosts数据配置")
         middle_group.setObjectName("middleGroup")
-        middle_group.setStyleSheet(self.STYLE_GROUP_BOX)
+        self._middle_group = middle_group
         middle_layout = QVBoxLayout(middle_group)
         middle_layout.setContentsMargins(10, 20, 10, 10)
 
-        self.hosts_edit = QTextEdit()
+        # hosts数据是纯文本，QPlainTextEdit免去富文本布局引擎和
+        # HTML解析开销，大段hosts条目的编辑与回显更轻量；
+        # 撤销栈保留：这是用户手工编辑区，Ctrl+Z是基本预期，
+        # 纯文本文档的撤销快照只存文本差量，代价可以接受
+        self.hosts_edit = QPlainTextEdit()
+        self.hosts_edit.setObjectName("hostsEdit")
         self.hosts_edit.setPlaceholderText("在这里输入需要监控的hosts数据...")
-        self.hosts_edit.setFont(QFont("Consolas", 10))
-        self.hosts_edit.setStyleSheet(
-            "border: 1px solid #cccccc; border-radius: 4px; background-color: #ffffff;"
-        )
-        self.hosts_edit.setText(config.get_hosts_data())
+        # 等宽字体只构造一次，两个文本控件复用（setFont按值拷贝）
+        mono_font = QFont("Consolas", 10)
+        self.hosts_edit.setFont(mono_font)
+        self.hosts_edit.setPlainText(config.get_hosts_data())
         middle_layout.addWidget(self.hosts_edit)
 
         save_layout = QHBoxLayout()
         save_layout.addStretch(1)
 
         self.save_btn = QPushButton("保存配置")
+        self.save_btn.setObjectName("saveBtn")
         self.save_btn.setMinimumWidth(120)
-        self.save_btn.setStyleSheet(self.STYLE_PRIMARY_BUTTON)
-        # 使用cast消除类型检查警告
-        if TYPE_CHECKING:
-            cast(PyQtSignalInstance, self.save_btn.clicked).connect(self.save_config)
-        else:
-            self.save_btn.clicked.connect(self.save_config)
+        self.save_btn.clicked.connect(self.save_config)
         save_layout.addWidget(self.save_btn)
 
         middle_layout.addLayout(save_layout)
@@ -616,29 +624,35 @@ class HostsMonitorUI(QMainWindow):
         # 下栏 - 日志
         bottom_group = QGroupBox("运行日志")
         bottom_group.setObjectName("bottomGroup")
-        bottom_group.setStyleSheet(self.STYLE_GROUP_BOX)
         bottom_layout = QVBoxLayout(bottom_group)
         bottom_layout.setContentsMargins(10, 20, 10, 10)
 
-        self.log_view = QTextEdit()
+        # 日志视图用QPlainTextEdit：按块布局，追加代价与文档总量无关，
+        # 且限制最大块数使长时间运行下内存与重绘成本保持有界
+        self.log_view = QPlainTextEdit()
+        self.log_view.setObjectName("logView")
         self.log_view.setReadOnly(True)
-        self.log_view.setFont(QFont("Consolas", 9))
-        self.log_view.setStyleSheet(
-            "border: 1px solid #cccccc; border-radius: 4px; background-color: #f5f5f5;"
-        )
-        # 启用自动换行
-        self.log_view.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+        mono_font.setPointSize(9)
+        self.log_view.setFont(mono_font)
+        self.log_view.document().setMaximumBlockCount(5000)
+        # 自动换行无需显式设置：WidgetWidth本就是QPlainTextEdit的默认值
+        # 缓存一个文档末尾游标供批量刷入复用，省去每次追加的游标构造
+        # 和append隐式的文档末尾定位
+        self._log_cursor = self.log_view.textCursor()
         bottom_layout.addWidget(self.log_view)
 
         main_layout.addWidget(bottom_group)
 
         # 不使用setStretch，而是通过调整窗口大小事件处理来设置高度
-        self.resized_flag = False  # 标记是否已调整过尺寸
+        self._did_initial_adjust = False  # 首次显示时是否已同步调整过尺寸
 
     def connect_signals(self) -> None:
         """连接信号"""
-        # 日志更新信号
-        self.log_updated.connect(self.update_log_view)
+        # 日志更新信号：由日志回调在工作线程发出，显式声明队列连接，
+        # 省去Qt每次emit时的发送方线程亲和性判断
+        self.log_updated.connect(
+            self.update_log_view, Qt.ConnectionType.QueuedConnection
+        )
 
         # 管理员权限状态变更信号
         self.admin_status_changed.connect(self.update_admin_button)
@@ -649,6 +663,16 @@ class HostsMonitorUI(QMainWindow):
         # 监控状态变更信号
         self.monitor_status_changed.connect(self.update_monitor_button)
 
+        # 后台自启状态查询结果信号（工作线程发出，槽在GUI线程执行）
+        self.autostart_state_ready.connect(self._apply_autostart_state)
+
+        # 后台自启切换完成信号（工作线程发出，槽在GUI线程收尾/回滚）
+        self.autostart_toggle_done.connect(self._on_autostart_toggle_done)
+
+        # 订阅监控模块的状态边沿通知：线程启动/退出时即时推送，
+        # 取代原先每5秒一次的is_alive()轮询
+        monitor.set_status_callback(self._on_monitor_state)
+
         # 延迟导入controller以避免循环导入
         try:
             from .controller import controller as ctrl
@@ -660,22 +684,27 @@ class HostsMonitorUI(QMainWindow):
         except ImportError as e:
             logger.warning(f"无法加载控制器模块: {str(e)}，某些功能可能不可用")
 
+    @pyqtSlot()
     def check_admin_privileges(self) -> None:
         """检查管理员权限"""
         is_admin = self.is_admin()
         self.admin_status_changed.emit(is_admin)
 
     def is_admin(self) -> bool:
-        """检查是否具有管理员权限"""
+        """检查是否具有管理员权限（进程内缓存，只调用一次Win32接口）"""
+        if self._is_admin_cache is not None:
+            return self._is_admin_cache
         try:
             # 使用utils模块中的函数
             from .utils import is_admin as utils_is_admin
 
-            return utils_is_admin()
+            self._is_admin_cache = utils_is_admin()
+            return self._is_admin_cache
         except Exception as e:
             logger.error(f"检查管理员权限时出错: {str(e)}")
             return False
 
+    @pyqtSlot(bool)
     def update_admin_button(self, is_admin: bool) -> None:
         """更新管理员按钮状态"""
         if is_admin:
@@ -689,14 +718,14 @@ class HostsMonitorUI(QMainWindow):
 
     # 移除使用任务计划的方法，改为直接使用pyuac
 
+    @pyqtSlot()
     def run_as_admin(self) -> None:
         """使用pywin32实现静默管理员权限启动"""
         # 导入工具函数
-        from .utils import is_admin, run_as_admin as utils_run_as_admin
         from .main import register_system_restart
 
-        # 检查是否已经是管理员权限
-        if is_admin():
+        # 检查是否已经是管理员权限（使用缓存结果，免去重复Win32调用）
+        if self.is_admin():
             QMessageBox.information(
                 self, "已具有管理员权限", "程序已经以管理员权限运行。"
             )
@@ -719,187 +748,127 @@ class HostsMonitorUI(QMainWindow):
                 QMessageBox.information(
                     self, "配置成功", "已成功配置以管理员权限运行，程序将重新启动。"
                 )
-
-                # 使用工具函数尝试UAC提权直接重启
-                # 获取程序路径信息
-                from .utils import get_app_paths
-
-                paths = get_app_paths()
-
-                # 准备应用程序路径和参数
-                app_path = paths["app_path"]
-                if paths["is_frozen"]:
-                    # 如果是打包的可执行文件
-                    app_args = "--already-trying-uac"
-                else:
-                    # 如果是Python脚本模式
-                    script_path = paths["script_path"]
-                    # 对于Python脚本，确保正确传递脚本路径作为参数
-                    app_args = f'"{script_path}" --already-trying-uac'
-
-                # 获取工作目录
-                work_dir = paths["app_dir"]
-
-                # 记录详细提权信息
-                logger.info(f"准备以UAC方式提权启动")
-                logger.info(f"应用路径: {app_path}")
-                logger.info(f"应用参数: {app_args}")
-                logger.info(f"工作目录: {work_dir}")
-
-                # 使用工具函数尝试UAC提权
-                success = utils_run_as_admin(
-                    app_path=app_path, app_args=app_args, work_dir=work_dir
-                )
-
-                if success:
-                    # 关闭系统托盘图标
-                    self.tray_icon.hide()
-
-                    # 给新进程更多时间启动
-                    logger.info("等待新实例启动...")
-                    # 添加短暂延迟
-                    import time
-
-                    time.sleep(0.5)
-
-                    # 退出当前实例
-                    logger.info("即将关闭当前实例，程序将以管理员权限重新启动")
-                    QTimer.singleShot(2000, QApplication.quit)
-                else:
-                    # 提权失败
-                    QMessageBox.critical(
-                        self, "错误", "以管理员权限运行失败，请查看日志了解详情。"
-                    )
             else:
                 # 如果注册失败，尝试使用传统UAC方式
                 logger.warning("pywin32配置失败，尝试传统UAC提权")
 
-                # 获取程序路径信息
-                from .utils import get_app_paths
+            # 两个分支的提权流程完全一致，收敛到单一实现
+            self._do_uac_elevate()
+        except Exception as e:
+            logger.error(f"以管理员权限运行失败: {str(e)}")
+            QMessageBox.critical(self, "错误", f"以管理员权限运行失败: {str(e)}")
 
-                paths = get_app_paths()
+    def _do_uac_elevate(self) -> bool:
+        """构建提权参数并通过UAC启动管理员权限的新实例
 
-                # 准备应用程序路径和参数
-                app_path = paths["app_path"]
-                if paths["is_frozen"]:
-                    # 如果是打包的可执行文件
-                    app_args = "--already-trying-uac"
-                else:
-                    # 如果是Python脚本模式
-                    script_path = paths["script_path"]
-                    # 对于Python脚本，确保正确传递脚本路径作为参数
-                    app_args = f'"{script_path}" --already-trying-uac'
-
-                # 获取工作目录
-                work_dir = paths["app_dir"]
-
-                # 记录详细提权信息
-                logger.info(f"准备以UAC方式提权启动")
-                logger.info(f"应用路径: {app_path}")
-                logger.info(f"应用参数: {app_args}")
-                logger.info(f"工作目录: {work_dir}")
-
-                # 使用工具函数尝试UAC提权
-                success = utils_run_as_admin(
-                    app_path=app_path, app_args=app_args, work_dir=work_dir
-                )
+        成功后隐藏托盘图标并安排当前实例退出；失败时弹出错误提示。
+        """
+        from .utils import get_app_paths, run_as_admin as utils_run_as_admin
 
-                if success:
-                    logger.info("管理员权限的新实例通过UAC启动，当前实例即将退出")
+        # 获取程序路径信息
+        paths = get_app_paths()
 
-                    # 关闭系统托盘图标
-                    self.tray_icon.hide()
+        # 准备应用程序路径和参数
+        app_path = paths["app_path"]
+        if paths["is_frozen"]:
+            # 如果是打包的可执行文件
+            app_args = "--already-trying-uac"
+        else:
+            # 如果是Python脚本模式
+            script_path = paths["script_path"]
+            # 对于Python脚本，确保正确传递脚本路径作为参数
+            app_args = f'"{script_path}" --already-trying-uac'
+
+        # 获取工作目录
+        work_dir = paths["app_dir"]
+
+        # 记录详细提权信息
+        logger.info(f"准备以UAC方式提权启动")
+        logger.info(f"应用路径: {app_path}")
+        logger.info(f"应用参数: {app_args}")
+        logger.info(f"工作目录: {work_dir}")
+
+        # 使用工具函数尝试UAC提权
+        success = utils_run_as_admin(
+            app_path=app_path, app_args=app_args, work_dir=work_dir
+        )
 
-                    # 给新进程更多时间启动
-                    logger.info("等待新实例启动...")
-                    # 添加短暂延迟
-                    import time
+        if success:
+            # 关闭系统托盘图标
+            self.tray_icon.hide()
 
-                    time.sleep(0.5)
+            # 延迟退出由下面的定时器非阻塞完成，足够给新实例启动时间，
+            # GUI线程不做任何sleep，提权期间界面保持响应
+            logger.info("即将关闭当前实例，程序将以管理员权限重新启动")
+            QTimer.singleShot(2000, QApplication.quit)
+        else:
+            # 提权失败
+            QMessageBox.critical(
+                self, "错误", "以管理员权限运行失败，请查看日志了解详情。"
+            )
 
-                    # 退出当前实例
-                    logger.info("即将关闭当前实例，程序将以管理员权限重新启动")
-                    QTimer.singleShot(2000, QApplication.quit)
-                else:
-                    # 提权失败
-                    QMessageBox.critical(
-                        self, "错误", "以管理员权限运行失败，请查看日志了解详情。"
-                    )
-        except Exception as e:
-            logger.error(f"以管理员权限运行失败: {str(e)}")
-            QMessageBox.critical(self, "错误", f"以管理员权限运行失败: {str(e)}")
+        return success
 
+    @pyqtSlot(int)
     def toggle_autostart(self, state: int) -> None:
-        """切换开机自启状态"""
-        # 导入工具函数
-        try:
-            from .utils import set_autostart
-        except ImportError as e:
-            logger.error(f"导入set_autostart函数失败: {str(e)}")
-            QMessageBox.critical(self, "错误", "无法设置开机自启，缺少必要的函数支持")
-            # 在UI上回滚复选框状态但不退出程序
-            self.autostart_cb.blockSignals(True)  # 暂时阻止信号触发递归调用
-            self.autostart_cb.setChecked(not self.autostart_cb.isChecked())
-            self.autostart_cb.blockSignals(False)
-            return
+        """切换开机自启状态
 
-        # 启用或禁用自启动
-        try:
-            is_checked = state == Qt.CheckState.Checked.value
-            action_desc = "设置" if is_checked else "取消"
+        任务计划/快捷方式的增删是慢速系统调用，放到后台线程执行，
+        结果经autostart_toggle_done信号送回GUI线程收尾或回滚。
+        """
+        is_checked = state == Qt.CheckState.Checked.value
+        action_desc = "设置" if is_checked else "取消"
 
-            logger.info(f"正在{action_desc}开机自启...")
+        logger.info(f"正在{action_desc}开机自启...")
 
-            # 使用工具函数设置自启动
-            result = False
+        # 后台操作期间禁用复选框，防止重复触发
+        self.autostart_cb.setEnabled(False)
+
+        def work() -> None:
+            success = False
             try:
-                result = set_autostart(enable=is_checked)
+                from .utils import set_autostart
+
+                success = set_autostart(enable=is_checked)
             except Exception as e:
                 logger.error(f"调用set_autostart函数时出错: {str(e)}")
-                raise
+            self.autostart_toggle_done.emit(success, is_checked)
 
-            if result:
-                logger.info(f"已{action_desc}开机自启")
+        threading.Thread(target=work, daemon=True).start()
 
-                # 更新配置
-                config.set("general", "auto_start", is_checked)
-                config.save_config()
-            else:
-                # 设置失败，抛出异常统一处理
-                logger.warning(f"{action_desc}开机自启返回失败结果")
-                raise Exception(f"{action_desc}开机自启失败")
+    @pyqtSlot(bool, bool)
+    def _on_autostart_toggle_done(self, success: bool, is_checked: bool) -> None:
+        """后台自启切换完成后的UI收尾（GUI线程执行）"""
+        action_desc = "设置" if is_checked else "取消"
+        self.autostart_cb.setEnabled(True)
 
-        except Exception as e:
-            # 统一处理异常
-            error_msg = f"{action_desc}开机自启失败: {str(e)}"
-            logger.error(error_msg)
+        if success:
+            logger.info(f"已{action_desc}开机自启")
 
-            try:
-                QMessageBox.critical(
-                    self, "错误", f"{action_desc}开机自启失败，请查看日志"
-                )
-            except Exception as msg_ex:
-                logger.error(f"显示错误对话框失败: {str(msg_ex)}")
+            # 更新配置（批量接口，单次落盘）
+            config.set_many({"general": {"auto_start": is_checked}})
+            return
 
-            # 回滚复选框状态，使用阻塞信号防止递归触发
-            try:
-                self.autostart_cb.blockSignals(True)  # 暂时阻止信号触发递归调用
-                self.autostart_cb.setChecked(not is_checked)
-                self.autostart_cb.blockSignals(False)
-            except Exception as cb_ex:
-                logger.error(f"回滚复选框状态失败: {str(cb_ex)}")
+        logger.error(f"{action_desc}开机自启失败")
+
+        try:
+            QMessageBox.critical(
+                self, "错误", f"{action_desc}开机自启失败，请查看日志"
+            )
+        except Exception as msg_ex:
+            logger.error(f"显示错误对话框失败: {str(msg_ex)}")
 
+        # 回滚复选框状态，使用阻塞信号防止递归触发
+        self.autostart_cb.blockSignals(True)
+        self.autostart_cb.setChecked(not is_checked)
+        self.autostart_cb.blockSignals(False)
+
+    @pyqtSlot()
     def open_hosts_file(self) -> None:
         """打开hosts文件"""
         try:
-            # 获取hosts文件路径
-            hosts_path = os.path.join(
-                os.environ.get("SystemRoot", r"C:\Windows"),
-                "System32",
-                "drivers",
-                "etc",
-                "hosts",
-            )
+            # 获取hosts文件路径（统一由监控模块提供，避免重复拼装）
+            hosts_path = monitor.get_hosts_path()
 
             # 使用记事本打开
             if os.path.exists(hosts_path):
@@ -912,43 +881,34 @@ class HostsMonitorUI(QMainWindow):
             logger.error(f"打开hosts文件失败: {str(e)}")
             QMessageBox.critical(self, "错误", f"打开hosts文件失败: {str(e)}")
 
-    def save_config(self) -> None:
-        """保存配置"""
-        try:
-            # 获取延迟时间（毫秒）
-            try:
-                delay_text = self.delay_edit.text().strip()
-                if not delay_text:
-                    delay_time = 3000  # 默认值（毫秒）
-                    logger.warning("延迟时间为空，使用默认值3000毫秒")
-                else:
-                    delay_time = int(delay_text)
-                    if delay_time < 1:
-                        delay_time = 1
-                        logger.warning("延迟时间小于1毫秒，已调整为1毫秒")
-                    elif delay_time > 10000:
-                        delay_time = 10000
-                        logger.warning("延迟时间大于10000毫秒，已调整为10000毫秒")
-            except ValueError as e:
-                logger.error(f"延迟时间格式错误: {str(e)}，使用默认值3000毫秒")
-                delay_time = 3000
-                QMessageBox.warning(
-                    self, "警告", f"延迟时间格式错误，已使用默认值3000毫秒"
-                )
+    def _commit_delay_time(self, delay_time: int) -> bool:
+        """延迟时间有变化时更新缓存、配置项与监控去抖动时间
 
-            # 更新配置
-            config.set("general", "delay_time", delay_time)
+        保存与应用两条路径共用，配置项只改内存，落盘由调用方统一执行。
 
-            # 更新hosts数据
-            hosts_data = self.hosts_edit.toPlainText()
-            config.set_hosts_data(hosts_data)
+        返回:
+            bool: 延迟时间是否发生了变化
+        """
+        if delay_time == self._delay_time_ms:
+            return False
 
-            # 更新监控模块的去抖动时间（毫秒转秒）
-            debounce_time = delay_time / 1000.0
-            monitor.set_debounce_time(debounce_time)
+        config.set("general", "delay_time", delay_time)
+        self._delay_time_ms = delay_time
 
-            # 保存配置
-            if config.save_config():
+        # 更新监控模块的去抖动时间（毫秒转秒）
+        monitor.set_debounce_time(delay_time / 1000.0)
+        return True
+
+    @pyqtSlot()
+    def save_config(self) -> None:
+        """保存配置"""
+        try:
+            # 获取延迟时间（毫秒），控件已保证取值在1-10000范围内，
+            # 有变化时由公共路径更新配置项与监控模块
+            self._commit_delay_time(self.delay_edit.value())
+
+            # hosts数据与上面的延迟修改在set_many中一次性落盘
+            if config.set_many({"hosts": {"data": self.hosts_edit.toPlainText()}}):
                 logger.info("配置已保存")
                 self.config_saved.emit()
             else:
@@ -958,102 +918,158 @@ class HostsMonitorUI(QMainWindow):
             logger.error(f"保存配置失败: {str(e)}")
             QMessageBox.critical(self, "错误", f"保存配置失败: {str(e)}")
 
+    @pyqtSlot()
     def on_config_saved(self) -> None:
         """配置保存后的处理"""
         # 配置更改后直接触发对比检查
         logger.info("配置已更改，立即触发对比检查")
         contrast_module.start()
 
+    def _on_monitor_state(self, running: bool) -> None:
+        """监控模块状态边沿回调（在监控线程中调用，仅发信号）"""
+        self._emit_monitor_state(running)
+
+    def _emit_monitor_state(self, running: bool) -> None:
+        """仅在监控状态发生变化时发射monitor_status_changed"""
+        if running != self._last_emitted_monitor_state:
+            self._last_emitted_monitor_state = running
+            self.monitor_status_changed.emit(running)
+
+    @pyqtSlot()
     def check_monitor_status(self) -> None:
-        """检查监控状态"""
+        """检查一次当前监控状态（启动时的初始查询，之后由边沿通知驱动）"""
         # 通过检查线程是否活跃来判断监控状态
-        if (
+        is_running = bool(
             hasattr(monitor, "monitor_thread")
             and monitor.monitor_thread
             and monitor.monitor_thread.is_alive()
-        ):
-            if not self.is_monitoring:  # 状态变化时才记录
-                logger.info("监控状态检查: 监控正在运行")
-            self.is_monitoring = True
-        else:
-            if self.is_monitoring:  # 状态变化时才记录
-                logger.info("监控状态检查: 监控已停止")
-            self.is_monitoring = False
-
-        # 更新UI显示
-        self.monitor_status_changed.emit(self.is_monitoring)
+        )
 
-        # 每5秒检查一次监控状态
-        QTimer.singleShot(5000, self.check_monitor_status)
+        # 更新UI显示（状态未变时不重复发射）
+        self._emit_monitor_state(is_running)
 
+    @pyqtSlot(bool)
     def update_monitor_button(self, is_monitoring: bool) -> None:
         """更新监控状态显示"""
+        if is_monitoring != self.is_monitoring:  # 状态变化时才记录
+            logger.info(
+                "监控状态: 监控正在运行" if is_monitoring else "监控状态: 监控已停止"
+            )
+        self.is_monitoring = is_monitoring
         self.monitor_status_label.setText(
             "监控状态: 运行中" if is_monitoring else "监控状态: 已停止"
         )
         self.apply_status_style(self.monitor_status_label, is_monitoring)
 
+    @pyqtSlot()
     def manual_contrast(self) -> None:
         """手动执行对比"""
         logger.info("手动触发对比检查")
         contrast_module.start()
 
+    @pyqtSlot()
     def apply_delay_time(self) -> None:
         """应用延迟时间设置"""
         try:
-            # 获取延迟时间（毫秒）
-            delay_time = int(self.delay_edit.text())
-            if delay_time < 1 or delay_time > 10000:
-                raise ValueError("延迟时间必须在1-10000毫秒范围内")
+            # 获取延迟时间（毫秒），控件已保证取值在1-10000范围内
+            delay_time = self.delay_edit.value()
 
-            # 更新配置
-            config.set("general", "delay_time", delay_time)
+            # 无变化时直接返回，不做多余的落盘与对比
+            if not self._commit_delay_time(delay_time):
+                logger.info("延迟时间未变化")
+                return
 
             # 保存配置
             if config.save_config():
                 logger.info(f"延迟时间已更新为 {delay_time} 毫秒")
 
-                # 更新监控模块的去抖动时间（毫秒转秒）
-                debounce_time = delay_time / 1000.0
-                monitor.set_debounce_time(debounce_time)
-
                 # 触发一次对比检查
                 contrast_module.start()
             else:
                 logger.error("保存延迟时间设置失败")
 
-        except ValueError as e:
-            logger.error(f"应用延迟时间失败: {str(e)}")
-            QMessageBox.critical(self, "错误", f"应用延迟时间失败: {str(e)}")
         except Exception as e:
             logger.error(f"应用延迟时间时发生错误: {str(e)}")
             QMessageBox.critical(self, "错误", f"应用延迟时间时发生错误: {str(e)}")
 
+    @staticmethod
+    def _format_log_message(message: str) -> str:
+        """根据消息中的级别关键词着色（单次正则扫描）"""
+        m = _LEVEL_RE.search(message)
+        if m:
+            color = _LEVEL_COLORS[m.group(0)]
+            return f'<span style="color:{color};">{message}</span>'
+        # 默认消息颜色
+        return message
+
+    def enqueue_log(self, message: str) -> None:
+        """从任意线程提交日志消息（已着色HTML，只入环形缓冲，不触碰Qt对象）"""
+        self._log_ring.append(message)
+
+    @pyqtSlot()
+    def _drain_log_ring(self) -> None:
+        """GUI线程周期性取走环形缓冲中的日志并进入批量刷入路径
+
+        环形缓冲中的消息已在发射线程完成着色，这里只做搬运。
+        """
+        ring = self._log_ring
+        if not ring:
+            return
+
+        while ring:
+            self._log_buf.append(ring.popleft())
+
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    @pyqtSlot(str)
     def update_log_view(self, message: str) -> None:
-        """更新日志视图，根据消息类型使用不同颜色"""
-        # 根据消息类型设置不同颜色
-        if "错误" in message or "失败" in message:
-            # 错误消息使用红色
-            formatted_message = f'<span style="color:#e74c3c;">{message}</span>'
-        elif "警告" in message:
-            # 警告消息使用橙色
-            formatted_message = f'<span style="color:#e67e22;">{message}</span>'
-        elif "成功" in message or "已保存" in message:
-            # 成功消息使用绿色
-            formatted_message = f'<span style="color:#27ae60;">{message}</span>'
-        elif "信息" in message or "提示" in message:
-            # 信息消息使用蓝色
-            formatted_message = f'<span style="color:#2980b9;">{message}</span>'
-        else:
-            # 默认消息颜色
-            formatted_message = message
+        """更新日志视图，根据消息类型使用不同颜色
 
-        # 追加消息到日志视图
-        self.log_view.append(formatted_message)
+        log_updated信号的节流入口：消息只进缓冲并启动合并定时器，
+        与环形缓冲排水路径共用同一批量刷入管道。
+        """
+        formatted_message = self._format_log_message(message)
+
+        # 只入缓冲并启动合并定时器，由_flush_log_buffer统一刷入视图。
+        # 窗口隐藏（最小化到托盘）时不刷入控件：文本布局开销全部省掉，
+        # 缓冲有界滚动，重新显示窗口时由showEvent一次性补齐
+        self._log_buf.append(formatted_message)
+        if self.isVisible() and not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    @pyqtSlot()
+    def _flush_log_buffer(self) -> None:
+        """把缓冲中的日志一次性刷入视图并按需滚动到底部"""
+        if not self._log_buf:
+            return
 
-        # 滚动到底部
+        # 插入前记录用户是否停在底部：翻看历史日志时不打断其位置
         scrollbar = self.log_view.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        # 批量追加期间关闭控件重绘，整批只触发一次repaint；
+        # 用缓存的末尾游标直接写文档，避开append的逐条定位开销
+        self.log_view.setUpdatesEnabled(False)
+        try:
+            cursor = self._log_cursor
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            doc_empty = self.log_view.document().isEmpty()
+            for message in self._log_buf:
+                if doc_empty:
+                    doc_empty = False
+                else:
+                    cursor.insertBlock()
+                # 重置字符格式，防止上一条带色消息的样式渗透到纯文本行
+                cursor.setCharFormat(QTextCharFormat())
+                cursor.insertHtml(message)
+            self._log_buf.clear()
+        finally:
+            self.log_view.setUpdatesEnabled(True)
+
+        # 仅当用户原本就在底部时才自动滚动
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         """窗口大小变更事件处理"""
@@ -1061,40 +1077,67 @@ class HostsMonitorUI(QMainWindow):
         # 调用调整高度方法
         self.adjust_layout_heights()
 
-        # 不在每次调整大小时保存，避免频繁写入配置文件
-        # 而是在窗口关闭时保存
+        # 防抖保存：重启计时，停止缩放500毫秒后才写一次配置
+        self._geom_save_timer.start()
 
     def moveEvent(self, event: QMoveEvent) -> None:
         """窗口移动事件处理"""
         super().moveEvent(event)
 
-        # 不在每次移动时保存，避免频繁写入配置文件
-        # 而是在窗口关闭时保存
+        # 防抖保存：重启计时，停止移动500毫秒后才写一次配置
+        self._geom_save_timer.start()
 
     def showEvent(self, event: QShowEvent) -> None:
         """窗口显示事件，用于初始化高度设置"""
         super().showEvent(event)
-        # 显示后立即触发一次尺寸调整
-        QTimer.singleShot(100, self.adjust_layout_heights)
-
+        # 首次显示时同步调整一次尺寸，后续由resizeEvent路径维护；
+        # 不再延迟100毫秒，避免首帧出现短暂的未对齐布局
+        if not self._did_initial_adjust:
+            self._did_initial_adjust = True
+            self.adjust_layout_heights()
+
+        # 窗口可见期间才运行环形缓冲排水定时器
+        self._log_drain_timer.start()
+
+        # 把窗口隐藏期间积压的日志一次性刷入视图
+        self._drain_log_ring()
+        if self._log_buf and not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        """窗口隐藏事件：停掉排水定时器，隐藏期间日志只进环形缓冲"""
+        super().hideEvent(event)
+        self._log_drain_timer.stop()
+
+    @pyqtSlot()
     def adjust_layout_heights(self) -> None:
-        """调整布局高度"""
+        """调整布局高度（使用构造时缓存的分组引用，缩放路径无树遍历）"""
         central_height = self.centralWidget().height()
 
         # 设置上栏固定高度
-        top_group = self.findChild(QGroupBox, "topGroup")
-        if top_group:
-            top_group.setFixedHeight(self.TOP_GROUP_HEIGHT)
+        self._top_group.setFixedHeight(self.TOP_GROUP_HEIGHT)
 
         # 设置中栏高度
         middle_height = int((central_height - self.TOP_GROUP_HEIGHT) * 0.4)
         if middle_height > 0:
-            middle_group = self.findChild(QGroupBox, "middleGroup")
-            if middle_group:
-                middle_group.setFixedHeight(middle_height)
+            self._middle_group.setFixedHeight(middle_height)
 
     def restore_window_geometry(self) -> None:
-        """从配置中恢复窗口大小和位置"""
+        """从配置中恢复窗口大小和位置
+
+        优先使用saveGeometry序列化的单键几何（含多屏信息），
+        旧配置没有该键时回退到逐字段恢复；成功保存一次新格式后
+        旧字段即不再被读取，仅为迁移保留。
+        """
+        geometry = config.get("window", "geometry", "")
+        if geometry:
+            try:
+                if self.restoreGeometry(QByteArray.fromBase64(geometry.encode("ascii"))):
+                    logger.info("已从配置恢复窗口几何")
+                    return
+            except Exception as e:
+                logger.warning(f"恢复窗口几何失败，回退到逐字段恢复: {str(e)}")
+
         width = config.get("window", "width", 550)
         height = config.get("window", "height", 750)
         pos_x = config.get("window", "pos_x", -1)
@@ -1107,35 +1150,39 @@ class HostsMonitorUI(QMainWindow):
         if pos_x >= 0 and pos_y >= 0:
             self.move(pos_x, pos_y)
         else:
-            # 居中显示
+            # 居中显示（屏幕几何只查询一次）
+            screen_geom = QApplication.primaryScreen().geometry()
             self.setGeometry(
-                QApplication.primaryScreen().geometry().width() // 2 - width // 2,
-                QApplication.primaryScreen().geometry().height() // 2 - height // 2,
+                screen_geom.width() // 2 - width // 2,
+                screen_geom.height() // 2 - height // 2,
                 width,
                 height,
             )
 
         logger.info(f"已从配置恢复窗口大小: {width}x{height}")
 
+    @pyqtSlot()
     def save_window_geometry(self) -> None:
-        """保存窗口大小和位置到配置"""
-        # 保存窗口大小
-        config.set("window", "width", self.width())
-        config.set("window", "height", self.height())
-
-        # 保存窗口位置
-        config.set("window", "pos_x", self.x())
-        config.set("window", "pos_y", self.y())
-
-        # 保存配置
-        config.save_config()
-        logger.info(
-            f"已保存窗口大小: {self.width()}x{self.height()}, 位置: ({self.x()}, {self.y()})"
+        """保存窗口大小和位置到配置
+
+        用saveGeometry把几何序列化成单个base64键：一次set一次写，
+        还天然携带多屏/DPI信息，免去逐字段读写。
+        """
+        geometry = bytes(self.saveGeometry().toBase64()).decode("ascii")
+        config.set("window", "geometry", geometry)
+
+        # 异步保存配置：几何保存可能在拖拽防抖后高频到达，
+        # 写盘交给后台线程合并，GUI线程不被磁盘I/O阻塞
+        config.request_save()
+        logger.debug(
+            "已保存窗口几何: %sx%s, 位置: (%s, %s)",
+            self.width(), self.height(), self.x(), self.y(),
         )
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """关闭事件处理"""
-        # 保存窗口大小和位置
+        # 停掉防抖计时器并立即保存窗口大小和位置
+        self._geom_save_timer.stop()
         self.save_window_geometry()
 
         if config.get("general", "minimize_to_tray", True):
@@ -1150,6 +1197,7 @@ class HostsMonitorUI(QMainWindow):
         else:
             self.quit_application()
 
+    @pyqtSlot()
     def quit_application(self) -> None:
         """退出应用程序"""
         reply = QMessageBox.question(
@@ -1164,14 +1212,14 @@ class HostsMonitorUI(QMainWindow):
             # 保存窗口大小和位置
             self.save_window_geometry()
 
+            # 停止后台写盘线程并把尚未落盘的修改同步刷出
+            config.flush()
+
             # 控制器负责停止监控，这里只隐藏托盘图标
             self.tray_icon.hide()
             QApplication.quit()
 
 
-# 移除自定义验证器类，使用QIntValidator替代
-
-
 def main():
     """UI模块的主函数入口点，支持单独运行"""
     import sys
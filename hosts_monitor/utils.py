@@ -9,7 +9,6 @@ import logging
 import os
 import subprocess
 import sys
-import tempfile
 import traceback
 import winreg
 import time
@@ -42,6 +41,25 @@ logger = logging.getLogger(__name__)
 # 应用名称常量
 # APP_NAME 已从版本模块导入
 
+# ShellExecuteW失败返回值（<=32）对应的中文错误说明，
+# 模块加载时构建一次，提权失败路径直接查表；
+# 覆盖MSDN文档中列出的全部失败码，未知值由get的默认串兜底
+_SHELL_EXECUTE_ERRORS = {
+    0: "系统内存或资源不足",
+    2: "指定的文件未找到",
+    3: "指定的路径未找到",
+    5: "拒绝访问",
+    8: "内存不足",
+    11: "无效的格式",
+    26: "共享冲突",
+    27: "文件名不完整或无效",
+    28: "打印机脱机",
+    29: "已超时",
+    30: "文件已在使用中",
+    31: "没有关联的应用程序可执行此文件",
+    32: "操作已取消",
+}
+
 
 def is_admin() -> bool:
     """检查当前进程是否具有管理员权限"""
@@ -244,10 +262,17 @@ def get_task_service():
         return None
 
 
-def task_exists(task_name: str) -> bool:
-    """检查指定名称的任务计划是否存在"""
+def task_exists(task_name: str, scheduler=None) -> bool:
+    """检查指定名称的任务计划是否存在
+
+    参数:
+        task_name: 任务名称
+        scheduler: 可复用的任务计划服务对象；一次操作中有多个查询时
+            由调用方获取一次传入，避免每次查询都重新连接COM服务
+    """
     try:
-        scheduler = get_task_service()
+        if scheduler is None:
+            scheduler = get_task_service()
         if not scheduler:
             return False
 
@@ -548,23 +573,7 @@ def run_as_admin(app_path=None, app_args=None, work_dir=None):
             time.sleep(0.5)
             return True
         else:
-            error_codes = {
-                0: "系统内存或资源不足",
-                2: "指定的文件未找到",
-                3: "指定的路径未找到",
-                5: "拒绝访问",
-                8: "内存不足",
-                11: "无效的格式",
-                26: "共享冲突",
-                27: "文件名不完整或无效",
-                28: "打印机脱机",
-                29: "已超时",
-                30: "文件已在使用中",
-                31: "没有关联的应用程序可执行此文件",
-                32: "操作已取消",
-            }
-
-            error_msg = error_codes.get(ret, f"未知错误代码: {ret}")
+            error_msg = _SHELL_EXECUTE_ERRORS.get(ret, f"未知错误代码: {ret}")
             logger.error(f"请求管理员权限失败，返回值: {ret}，错误: {error_msg}")
             return False
     except Exception as e:
@@ -702,8 +711,13 @@ def sync_autostart_state(config):
     )
 
     try:
+        # 整个同步过程复用同一个任务计划服务连接：
+        # 下面的存在性检查与删除最多涉及十余次查询，逐次重连COM服务
+        # 是同步路径上最大的重复开销
+        scheduler = get_task_service()
+
         # 检查现有的自启动方式并清理
-        task_exists_flag = task_exists(task_name)
+        task_exists_flag = task_exists(task_name, scheduler)
         shortcut_exists_flag = os.path.exists(shortcut_path)
 
         # 增加调试日志
@@ -720,17 +734,16 @@ def sync_autostart_state(config):
         ]
 
         for check_name in task_names_to_check:
-            if task_exists(check_name):
+            if task_exists(check_name, scheduler):
                 logger.info(f"发现任务计划: {check_name}")
 
         # 如果配置为不自启动，则移除所有自启动方式
         if not auto_start:
             # 检查并删除所有相关的任务计划
             for task_check_name in task_names_to_check:
-                if task_exists(task_check_name):
-                    # 先尝试通过API删除
+                if task_exists(task_check_name, scheduler):
+                    # 先尝试通过API删除（复用已建立的服务连接）
                     try:
-                        scheduler = get_task_service()
                         if scheduler:
                             root_folder = scheduler.GetFolder("\\")
                             logger.info(f"正在尝试删除任务计划: {task_check_name}")
@@ -758,7 +771,7 @@ def sync_autostart_state(config):
 
             # 再次检查任务是否已删除
             for check_name in task_names_to_check:
-                if task_exists(check_name):
+                if task_exists(check_name, scheduler):
                     logger.warning(f"任务删除失败，仍然存在: {check_name}")
                 else:
                     logger.info(f"确认任务已删除: {check_name}")
@@ -788,7 +801,6 @@ def sync_autostart_state(config):
             # 删除任务计划，使用快捷方式
             if task_exists_flag:
                 try:
-                    scheduler = get_task_service()
                     if scheduler:
                         root_folder = scheduler.GetFolder("\\")
                         root_folder.DeleteTask(task_name, 0)
@@ -928,21 +940,21 @@ def force_delete_task(task_name):
         bool: 是否成功删除
     """
     try:
-        import subprocess
-
         # 检查任务是否存在
         if not task_exists(task_name):
             logger.info(f"任务 {task_name} 不存在，无需删除")
             return True
 
-        # 使用schtasks命令删除任务
+        # 使用schtasks命令删除任务：不经cmd.exe转发，stdout直接丢弃，
+        # 只保留stderr供失败时记录；CREATE_NO_WINDOW避免闪出控制台窗口
         logger.info(f"正在使用命令行强制删除任务: {task_name}")
         result = subprocess.run(
             ["schtasks", "/delete", "/tn", task_name, "/f"],
-            shell=True,
             check=False,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
+            creationflags=subprocess.CREATE_NO_WINDOW,
         )
 
         if result.returncode == 0:
@@ -952,6 +964,11 @@ def force_delete_task(task_name):
             logger.error(f"删除任务 {task_name} 失败，返回码: {result.returncode}")
             logger.error(f"错误信息: {result.stderr}")
 
+            # 已具备管理员权限时提权重试毫无意义（权限相同，结果必然
+            # 一致），直接失败返回，省掉一次powershell进程与UAC弹窗
+            if is_admin():
+                return False
+
             # 尝试使用更高权限的命令删除
             logger.info(f"尝试以管理员权限强制删除任务: {task_name}")
             admin_result = subprocess.run(
@@ -965,10 +982,11 @@ def force_delete_task(task_name):
                     "-WindowStyle",
                     "Hidden",
                 ],
-                shell=True,
                 check=False,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
+                creationflags=subprocess.CREATE_NO_WINDOW,
             )
 
             if admin_result.returncode == 0: